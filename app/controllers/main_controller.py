@@ -6,7 +6,7 @@ Implements the Controller part of the MVC pattern.
 """
 
 import asyncio
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Mapping, Sequence
 from PyQt6.QtCore import QObject, pyqtSignal, QThread, QTimer
 from loguru import logger
 
@@ -261,7 +261,7 @@ class MainController(QObject):
             self.error_occurred.emit(f"Failed to remove knowledge source: {e}")
             return False
     
-    async def send_message(self, message: str, chat_history: List[Dict[str, str]]) -> Optional[str]:
+    async def send_message(self, message: str, chat_history: Sequence[Mapping[str, str]]) -> Optional[str]:
         """Send a message and get AI response."""
         try:
             self.status_updated.emit("Generating response...")
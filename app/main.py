@@ -8,6 +8,7 @@ It initializes the PyQt6 application and launches the main window.
 
 import sys
 import logging
+import multiprocessing
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
@@ -96,4 +97,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for the HTML parse process pool in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     sys.exit(main())
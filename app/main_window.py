@@ -249,10 +249,12 @@ class MainWindow(QMainWindow):
     def create_right_panel(self):
         """Create the right panel with chat/preview widget."""
         # Chat widget
-        self.chat_widget = ChatWidget()
+        self.chat_widget = ChatWidget(max_messages=self.config_service.settings.max_chat_history)
 
         # Configuration manager widget (initially hidden)
-        self.config_manager_widget = ConfigurationManagerWidget()
+        self.config_manager_widget = ConfigurationManagerWidget(
+            cache_path=self.config_service.get_app_directory() / "cache" / "configuration_manager.json"
+        )
         self.config_manager_widget.setVisible(False)
 
         return self.chat_widget
@@ -717,7 +719,8 @@ class MainWindow(QMainWindow):
             # Save session state
             self.save_session_state()
 
-            # Save current configuration if any
+            # Save current configuration if any, including edits still debounced
+            self.instructions_widget.flush()
             if self.controller.current_gem_config:
                 self.controller.save_enhanced_configuration()
 
@@ -803,6 +806,7 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Save Configuration", "No configuration to save. Please create a new configuration first.")
             return
 
+        self.instructions_widget.flush()
         if self.controller.save_gem_configuration():
             QMessageBox.information(self, "Save Configuration", "Configuration saved successfully!")
         else:
@@ -812,11 +816,16 @@ class MainWindow(QMainWindow):
         """Show the settings dialog."""
         if self.settings_widget is None:
             self.settings_widget = SettingsWidget(self.config_service, self)
+            self.settings_widget.accepted.connect(self.on_settings_saved)
         
         self.settings_widget.show()
         self.settings_widget.raise_()
         self.settings_widget.activateWindow()
     
+    def on_settings_saved(self):
+        """Apply saved settings to the running widgets."""
+        self.chat_widget.set_max_messages(self.config_service.settings.max_chat_history)
+    
     def show_about(self):
         """Show the about dialog."""
         QMessageBox.about(
@@ -843,7 +852,8 @@ class MainWindow(QMainWindow):
     def save_session_state(self):
         """Save the current session state."""
         try:
-            # Auto-save current configuration
+            # Auto-save current configuration, including edits still debounced
+            self.instructions_widget.flush()
             if self.controller.current_gem_config:
                 self.controller.save_gem_configuration()
             logger.info("Session state saved")
@@ -78,9 +78,10 @@ class EnhancedGemConfiguration(BaseModel):
     
     def update_usage(self):
         """Update usage statistics."""
+        now = datetime.now()
         self.usage_count += 1
-        self.last_used_at = datetime.now()
-        self.modified_at = datetime.now()
+        self.last_used_at = now
+        self.modified_at = now
     
     def add_message(self):
         """Increment message count."""
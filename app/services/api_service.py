@@ -5,7 +5,7 @@ Handles all communication with external APIs, primarily Google Gemini API.
 """
 
 import asyncio
-from typing import Optional, List, Dict, Any, AsyncGenerator
+from typing import Optional, Dict, Any, AsyncGenerator, Mapping, Sequence
 from loguru import logger
 
 try:
@@ -81,7 +81,7 @@ class APIService:
         self,
         prompt: str,
         context: Optional[str] = None,
-        chat_history: Optional[List[Dict[str, str]]] = None
+        chat_history: Optional[Sequence[Mapping[str, str]]] = None
     ) -> Optional[str]:
         """Generate a response using the Gemini API."""
         try:
@@ -115,7 +115,7 @@ class APIService:
         self, 
         prompt: str, 
         context: Optional[str] = None,
-        chat_history: Optional[List[Dict[str, str]]] = None
+        chat_history: Optional[Sequence[Mapping[str, str]]] = None
     ) -> AsyncGenerator[str, None]:
         """Generate a streaming response using the Gemini API."""
         try:
@@ -141,7 +141,7 @@ class APIService:
         self, 
         user_prompt: str, 
         context: Optional[str] = None,
-        chat_history: Optional[List[Dict[str, str]]] = None
+        chat_history: Optional[Sequence[Mapping[str, str]]] = None
     ) -> str:
         """Build the complete prompt for the API."""
         parts = []
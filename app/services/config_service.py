@@ -43,8 +43,8 @@ class ConfigService:
     SERVICE_NAME = "CustomGeminiAgentGUI"
     API_KEY_NAME = "google_gemini_api_key"
     
-    def __init__(self):
-        self.app_dir = Path.home() / ".gemini_agent_gui"
+    def __init__(self, base_dir: Optional[Path] = None):
+        self.app_dir = (base_dir or Path.home()) / ".gemini_agent_gui"
         self.config_dir = self.app_dir / "config"
         self.gems_dir = self.app_dir / "gems"
         self.settings_file = self.config_dir / "settings.json"
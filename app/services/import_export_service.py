@@ -50,8 +50,7 @@ class ImportExportService:
             export_path = self.export_dir / filename
             
             # Save export file
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data.model_dump(), f, indent=2, default=str)
+            self._write_export(export_data, export_path)
             
             logger.info(f"Exported configuration '{config.name}' to {export_path}")
             return str(export_path)
@@ -89,8 +88,7 @@ class ImportExportService:
             export_path = self.export_dir / filename
             
             # Save export file
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data.model_dump(), f, indent=2, default=str)
+            self._write_export(export_data, export_path)
             
             logger.info(f"Exported workspace '{workspace.name}' to {export_path}")
             return str(export_path)
@@ -141,8 +139,7 @@ class ImportExportService:
             export_path = self.export_dir / filename
             
             # Save export file
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data.model_dump(), f, indent=2, default=str)
+            self._write_export(export_data, export_path)
             
             logger.info(f"Exported multiple items to {export_path}")
             return str(export_path)
@@ -172,8 +169,7 @@ class ImportExportService:
             backup_path = self.export_dir / filename
             
             # Save backup file
-            with open(backup_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data.model_dump(), f, indent=2, default=str)
+            self._write_export(export_data, backup_path)
             
             logger.info(f"Created backup at {backup_path}")
             return str(backup_path)
@@ -182,6 +178,10 @@ class ImportExportService:
             logger.error(f"Failed to create backup: {e}")
             return None
     
+    def _write_export(self, export_data: ConfigurationExport, export_path: Path):
+        """Serialize an export with pydantic's native JSON encoder and write it."""
+        export_path.write_text(export_data.model_dump_json(indent=2), encoding='utf-8')
+    
     def import_from_file(self, file_path: str, merge_mode: str = "skip") -> Dict[str, Any]:
         """Import data from a file.
         
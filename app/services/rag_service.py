@@ -7,36 +7,27 @@ vector storage, and similarity search.
 
 import os
 import hashlib
+import importlib.util
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from types import MappingProxyType
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, FrozenSet
 from loguru import logger
 
-# Try to import optional dependencies
-try:
-    import chromadb
-    from chromadb.config import Settings
-    CHROMADB_AVAILABLE = True
-except ImportError:
+# Locate optional dependencies without importing them; they are heavy, so they are
+# imported where first used instead of when this module is loaded
+CHROMADB_AVAILABLE = importlib.util.find_spec("chromadb") is not None
+if not CHROMADB_AVAILABLE:
     logger.warning("ChromaDB not available")
-    CHROMADB_AVAILABLE = False
 
-try:
-    from sentence_transformers import SentenceTransformer
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
-except ImportError:
+SENTENCE_TRANSFORMERS_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+if not SENTENCE_TRANSFORMERS_AVAILABLE:
     logger.warning("sentence-transformers not available")
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
-
-try:
-    from langchain.text_splitter import RecursiveCharacterTextSplitter
-    from langchain.document_loaders import (
-        TextLoader, PyPDFLoader, Docx2txtLoader,
-        DirectoryLoader, GitLoader
-    )
-    LANGCHAIN_AVAILABLE = True
-except ImportError:
+
+LANGCHAIN_AVAILABLE = importlib.util.find_spec("langchain") is not None
+if not LANGCHAIN_AVAILABLE:
     logger.warning("langchain not available")
-    LANGCHAIN_AVAILABLE = False
 
 from models.knowledge_source import KnowledgeSource, SourceType, SourceStatus
 from services.config_service import ConfigService
@@ -44,6 +35,38 @@ from services.google_drive_service import GoogleDriveService
 from services.web_scraping_service import WebScrapingService
 
 
+# Chunks written per collection.add call; each call is a separate SQLite/HNSW write
+CHROMA_BATCH_SIZE = 1000
+
+_CODE_EXTENSIONS = frozenset(['.py', '.js', '.java', '.cpp', '.c', '.h', '.php', '.rb', '.go', '.rs'])
+
+# File extension -> chunk type used for retrieval boosts; anything else is "text"
+_EXT_TO_TYPE = MappingProxyType({
+    **dict.fromkeys(_CODE_EXTENSIONS, "code"),
+    **dict.fromkeys(['.md', '.rst', '.txt'], "documentation"),
+    **dict.fromkeys(['.pdf', '.docx', '.doc'], "document"),
+    **dict.fromkeys(['.json', '.xml', '.yml', '.yaml'], "data"),
+})
+
+
+@dataclass
+class Chunks:
+    """Text chunks of a source, stored as the parallel lists ChromaDB expects."""
+    contents: List[str] = field(default_factory=list)
+    metadatas: List[Dict[str, Any]] = field(default_factory=list)
+    ids: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.contents)
+
+
+@lru_cache(maxsize=128)
+def _query_terms(query: str) -> Tuple[str, FrozenSet[str]]:
+    """Lowercased query and its word set, shared by every result scored for it."""
+    query_lower = query.lower()
+    return query_lower, frozenset(query_lower.split())
+
+
 class RAGService:
     """Service for managing the RAG system."""
     
@@ -56,7 +79,9 @@ class RAGService:
 
         # Initialize advanced ingestion services
         self.google_drive_service = GoogleDriveService(config_service)
-        self.web_scraping_service = WebScrapingService()
+        self.web_scraping_service = WebScrapingService(
+            cache_path=config_service.get_app_directory() / "cache" / "http_cache"
+        )
 
         self._initialize_components()
     
@@ -76,6 +101,11 @@ class RAGService:
                 logger.warning("langchain not available, document processing limited")
                 return
 
+            import chromadb
+            from chromadb.config import Settings
+            from sentence_transformers import SentenceTransformer
+            from langchain.text_splitter import RecursiveCharacterTextSplitter
+
             # Initialize embedding model
             model_name = self.config_service.settings.embedding_model
             logger.info(f"Loading embedding model: {model_name}")
@@ -144,18 +174,18 @@ class RAGService:
                 return False
 
             # Split documents into chunks with smart chunking
-            chunks = []
+            chunks = Chunks()
             for doc in documents:
                 doc_chunks = self._smart_chunk_document(doc)
+                chunk_type = self._determine_chunk_type(doc["metadata"].get("file_type", ""))
                 for i, chunk in enumerate(doc_chunks):
-                    chunks.append({
-                        "content": chunk,
-                        "metadata": {
-                            **doc["metadata"],
-                            "chunk_index": i,
-                            "source_id": source.id,
-                            "chunk_type": self._determine_chunk_type(doc["metadata"].get("file_type", ""))
-                        }
+                    chunks.ids.append(f"{source.id}_{len(chunks.contents)}")
+                    chunks.contents.append(chunk)
+                    chunks.metadatas.append({
+                        **doc["metadata"],
+                        "chunk_index": i,
+                        "source_id": source.id,
+                        "chunk_type": chunk_type
                     })
 
             if not chunks:
@@ -163,7 +193,7 @@ class RAGService:
                 return False
 
             # Generate embeddings and store in ChromaDB
-            self._store_chunks(chunks, source.id)
+            self._store_chunks(chunks)
 
             # Update source status
             source.file_count = len(documents)
@@ -189,7 +219,7 @@ class RAGService:
         file_type = doc["metadata"].get("file_type", "").lower()
 
         # Choose appropriate splitter based on file type
-        if file_type in ['.py', '.js', '.java', '.cpp', '.c', '.h', '.php', '.rb', '.go', '.rs']:
+        if file_type in _CODE_EXTENSIONS:
             return self.code_splitter.split_text(content)
         elif file_type in ['.md', '.rst']:
             return self.markdown_splitter.split_text(content)
@@ -198,18 +228,7 @@ class RAGService:
 
     def _determine_chunk_type(self, file_type: str) -> str:
         """Determine the type of content for better retrieval."""
-        file_type = file_type.lower()
-
-        if file_type in ['.py', '.js', '.java', '.cpp', '.c', '.h', '.php', '.rb', '.go', '.rs']:
-            return "code"
-        elif file_type in ['.md', '.rst', '.txt']:
-            return "documentation"
-        elif file_type in ['.pdf', '.docx', '.doc']:
-            return "document"
-        elif file_type in ['.json', '.xml', '.yml', '.yaml']:
-            return "data"
-        else:
-            return "text"
+        return _EXT_TO_TYPE.get(file_type.lower(), "text")
     
     def _load_documents(self, source: KnowledgeSource) -> List[Dict[str, Any]]:
         """Load documents from a knowledge source."""
@@ -249,6 +268,8 @@ class RAGService:
                 logger.warning(f"File not found: {file_path}")
                 return None
             
+            from langchain.document_loaders import TextLoader, PyPDFLoader, Docx2txtLoader
+
             # Choose loader based on file extension
             loader = None
             if path.suffix.lower() == '.pdf':
@@ -320,6 +341,7 @@ class RAGService:
             clone_dir = temp_dir / f"repo_{repo_hash}"
             
             # Use GitLoader from langchain
+            from langchain.document_loaders import GitLoader
             loader = GitLoader(
                 clone_url=repo_url,
                 repo_path=str(clone_dir),
@@ -397,33 +419,29 @@ class RAGService:
             logger.error(f"Failed to load URL {url}: {e}")
             return []
     
-    def _store_chunks(self, chunks: List[Dict[str, Any]], source_id: str):
+    def _store_chunks(self, chunks: Chunks):
         """Store text chunks in ChromaDB with batch processing."""
         try:
             if not chunks:
                 return
 
-            # Process in batches for better performance
-            batch_size = 100
+            batch_size = CHROMA_BATCH_SIZE
             total_chunks = len(chunks)
 
-            for i in range(0, total_chunks, batch_size):
-                batch = chunks[i:i + batch_size]
-
-                # Prepare batch data
-                texts = [chunk["content"] for chunk in batch]
-                metadatas = [chunk["metadata"] for chunk in batch]
-                ids = [f"{source_id}_{i + j}" for j in range(len(batch))]
+            # Encode every chunk in one call; the model micro-batches internally
+            embeddings = self.embedding_model.encode(
+                chunks.contents, batch_size=64, show_progress_bar=False, convert_to_numpy=True
+            )
 
-                # Generate embeddings for batch
-                embeddings = self.embedding_model.encode(texts, show_progress_bar=False).tolist()
+            for i in range(0, total_chunks, batch_size):
+                end = i + batch_size
 
                 # Store batch in ChromaDB
                 self.collection.add(
-                    embeddings=embeddings,
-                    documents=texts,
-                    metadatas=metadatas,
-                    ids=ids
+                    embeddings=embeddings[i:end].tolist(),
+                    documents=chunks.contents[i:end],
+                    metadatas=chunks.metadatas[i:end],
+                    ids=chunks.ids[i:end]
                 )
 
                 logger.debug(f"Stored batch {i//batch_size + 1}/{(total_chunks + batch_size - 1)//batch_size}")
@@ -450,12 +468,7 @@ class RAGService:
             # Generate query embedding
             query_embedding = self.embedding_model.encode([query]).tolist()[0]
 
-            # Build where clause for filtering
-            where_clause = {}
-            if content_type:
-                where_clause["chunk_type"] = content_type
-            if source_filter:
-                where_clause["source_id"] = source_filter
+            where_clause = self._build_where_clause(content_type, source_filter)
 
             # Search in ChromaDB
             search_kwargs = {
@@ -501,15 +514,36 @@ class RAGService:
             logger.error(f"Failed to search similar content: {e}")
             return []
 
+    @staticmethod
+    def _build_where_clause(content_type: Optional[str] = None,
+                            source_filter: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Build a ChromaDB metadata filter for a search.
+
+        ChromaDB applies the filter to the metadata index before the vector search,
+        so the candidates returned are already restricted to matching chunks. More
+        than one condition has to be combined with an explicit $and.
+        """
+        conditions = []
+        if content_type:
+            conditions.append({"chunk_type": content_type})
+        if source_filter:
+            conditions.append({"source_id": source_filter})
+
+        if not conditions:
+            return None
+        if len(conditions) == 1:
+            return conditions[0]
+        return {"$and": conditions}
+
     def _calculate_relevance_score(self, query: str, content: str, metadata: Dict,
                                  base_similarity: float) -> float:
         """Calculate enhanced relevance score."""
         score = base_similarity
+        query_lower, query_words = _query_terms(query)
 
-        # Boost score for exact keyword matches
-        query_words = set(query.lower().split())
-        content_words = set(content.lower().split())
-        keyword_overlap = len(query_words.intersection(content_words)) / len(query_words)
+        # Boost score for exact keyword matches; intersecting with the word iterable
+        # avoids building a set of the whole chunk
+        keyword_overlap = len(query_words.intersection(content.lower().split())) / max(1, len(query_words))
         score += keyword_overlap * 0.2
 
         # Boost score for recent content
@@ -519,9 +553,9 @@ class RAGService:
 
         # Boost score based on content type relevance
         chunk_type = metadata.get("chunk_type", "text")
-        if "code" in query.lower() and chunk_type == "code":
+        if "code" in query_lower and chunk_type == "code":
             score += 0.1
-        elif "documentation" in query.lower() and chunk_type == "documentation":
+        elif "documentation" in query_lower and chunk_type == "documentation":
             score += 0.1
 
         return min(score, 1.0)  # Cap at 1.0
@@ -111,11 +111,15 @@ class SessionService:
     
     def save_panel_state(self, panel_name: str, is_visible: bool):
         """Save panel visibility state."""
-        if self.current_session:
-            self.current_session.panel_states[panel_name] = is_visible
+        self.save_panel_states({panel_name: is_visible})
+    
+    def save_panel_states(self, panel_states: Dict[str, bool]):
+        """Save the visibility of several panels with a single session write."""
+        if self.current_session and panel_states:
+            self.current_session.panel_states.update(panel_states)
             self.current_session.update_activity()
             self._save_current_session()
-            logger.debug(f"Saved panel state: {panel_name} = {is_visible}")
+            logger.debug(f"Saved panel states: {panel_states}")
     
     def get_panel_state(self, panel_name: str, default: bool = True) -> bool:
         """Get panel visibility state."""
@@ -134,23 +134,55 @@ Encourage experimentation, think outside the box, and help users explore unconve
         ]
         
         # Save built-in templates if they don't exist
-        for template in builtin_templates:
-            if not self._template_exists(template.name):
-                self.save_template(template)
-                logger.info(f"Initialized built-in template: {template.name}")
+        for template in self.save_templates(builtin_templates, skip_existing=True):
+            logger.info(f"Initialized built-in template: {template.name}")
+    
+    def _write_template(self, template: ConfigurationTemplate, template_file: Path):
+        """Write a template's JSON to its file."""
+        with open(template_file, 'w', encoding='utf-8') as f:
+            json.dump(template.model_dump(), f, indent=2, default=str)
     
     def save_template(self, template: ConfigurationTemplate) -> bool:
         """Save a template to file."""
         try:
             template_file = self.templates_dir / f"{template.name.replace(' ', '_').lower()}.json"
-            with open(template_file, 'w', encoding='utf-8') as f:
-                json.dump(template.model_dump(), f, indent=2, default=str)
+            self._write_template(template, template_file)
             logger.info(f"Template '{template.name}' saved")
             return True
         except Exception as e:
             logger.error(f"Failed to save template: {e}")
             return False
     
+    def save_templates(self, templates: List[ConfigurationTemplate],
+                       skip_existing: bool = False) -> List[ConfigurationTemplate]:
+        """Save several templates, listing the templates directory at most once.
+        
+        Returns the templates that were written.
+        """
+        saved = []
+        try:
+            existing = {f.name for f in self.templates_dir.glob("*.json")} if skip_existing else set()
+            
+            for template in templates:
+                file_name = f"{template.name.replace(' ', '_').lower()}.json"
+                if file_name in existing:
+                    continue
+                
+                try:
+                    self._write_template(template, self.templates_dir / file_name)
+                    if skip_existing:
+                        existing.add(file_name)
+                    saved.append(template)
+                except Exception as e:
+                    logger.error(f"Failed to save template '{template.name}': {e}")
+            
+            if saved:
+                logger.info(f"Saved {len(saved)} templates")
+        except Exception as e:
+            logger.error(f"Failed to save templates: {e}")
+        
+        return saved
+    
     def load_template(self, name: str) -> Optional[ConfigurationTemplate]:
         """Load a template by name."""
         try:
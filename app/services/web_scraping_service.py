@@ -4,9 +4,13 @@ Web Scraping Service
 Handles web content extraction and processing for knowledge ingestion.
 """
 
+import importlib.util
+import os
 import re
 import time
-from urllib.parse import urljoin, urlparse, parse_qs
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from urllib.parse import urljoin, urlparse, urlunparse, parse_qs, parse_qsl, urlencode
 from typing import List, Dict, Any, Optional, Set
 from pathlib import Path
 from loguru import logger
@@ -20,34 +24,55 @@ except ImportError:
     logger.warning("requests library not available")
     REQUESTS_AVAILABLE = False
 
-try:
-    from bs4 import BeautifulSoup
-    BEAUTIFULSOUP_AVAILABLE = True
-except ImportError:
+# Parsers and the HTTP cache are located without importing them; they are imported
+# where first used, so loading this module does not pay for them
+REQUESTS_CACHE_AVAILABLE = importlib.util.find_spec("requests_cache") is not None
+
+BEAUTIFULSOUP_AVAILABLE = importlib.util.find_spec("bs4") is not None
+if not BEAUTIFULSOUP_AVAILABLE:
     logger.warning("beautifulsoup4 not available")
-    BEAUTIFULSOUP_AVAILABLE = False
 
-try:
-    import trafilatura
-    TRAFILATURA_AVAILABLE = True
-except ImportError:
+TRAFILATURA_AVAILABLE = importlib.util.find_spec("trafilatura") is not None
+if not TRAFILATURA_AVAILABLE:
     logger.warning("trafilatura not available")
-    TRAFILATURA_AVAILABLE = False
 
 
 class WebScrapingService:
     """Service for web content extraction."""
     
-    def __init__(self):
+    # Seconds a cached response stays fresh
+    CACHE_EXPIRE_AFTER = 3600
+    
+    def __init__(self, cache_path: Optional[Path] = None):
         self.session = None
+        self.cache_path = cache_path
         self.user_agent = "Custom Gemini Agent GUI/1.0 (Educational/Research Purpose)"
+        self.max_content_bytes = 5 * 1024 * 1024  # Skip bodies larger than 5 MB
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
         
         if REQUESTS_AVAILABLE:
             self._setup_session()
     
     def _setup_session(self):
-        """Setup requests session with retry strategy."""
-        self.session = requests.Session()
+        """Setup requests session with retry strategy.
+        
+        When a cache path is given and requests-cache is installed, responses are
+        kept in a SQLite cache so repeated scrapes of a URL skip the network.
+        """
+        if self.cache_path is not None and REQUESTS_CACHE_AVAILABLE:
+            import requests_cache
+            
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # The filter runs on headers before the cache reads the body, so
+            # responses that would not be scraped are never downloaded or stored
+            self.session = requests_cache.CachedSession(
+                cache_name=str(self.cache_path),
+                backend="sqlite",
+                expire_after=self.CACHE_EXPIRE_AFTER,
+                filter_fn=self._is_cacheable_response
+            )
+        else:
+            self.session = requests.Session()
         
         # Setup retry strategy
         retry_strategy = Retry(
@@ -82,33 +107,11 @@ class WebScrapingService:
         try:
             logger.info(f"Extracting content from: {url}")
             
-            # Fetch the page
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            # Extract content using available method
-            if TRAFILATURA_AVAILABLE:
-                content = self._extract_with_trafilatura(response.text, url)
-            elif BEAUTIFULSOUP_AVAILABLE:
-                content = self._extract_with_beautifulsoup(response.text, url)
-            else:
-                logger.error("No content extraction method available")
+            html = self._fetch_html(url)
+            if html is None:
                 return None
             
-            if content:
-                return {
-                    "content": content["text"],
-                    "metadata": {
-                        "source": url,
-                        "title": content.get("title", ""),
-                        "url": url,
-                        "content_length": len(content["text"]),
-                        "extraction_method": content.get("method", "unknown"),
-                        "file_type": ".html"
-                    }
-                }
-            
-            return None
+            return self._build_document(url, self._extract_html(html, url))
             
         except requests.RequestException as e:
             logger.error(f"Failed to fetch URL {url}: {e}")
@@ -117,9 +120,126 @@ class WebScrapingService:
             logger.error(f"Failed to extract content from {url}: {e}")
             return None
     
-    def _extract_with_trafilatura(self, html: str, url: str) -> Optional[Dict[str, str]]:
+    def _fetch_html(self, url: str) -> Optional[str]:
+        """Fetch the HTML body of a URL, or None if it should not be scraped."""
+        # Fetch the page headers first so large or non-HTML bodies can be skipped
+        response = self.session.get(url, timeout=30, stream=True)
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            response.close()
+            raise
+        
+        if not self._is_scrapable_response(response):
+            response.close()
+            return None
+        
+        return response.text
+    
+    @staticmethod
+    def _extract_html(html: str, url: str) -> Optional[Dict[str, str]]:
+        """Extract content from HTML using the available method.
+        
+        Static so it can be dispatched to the parse process pool.
+        """
+        if TRAFILATURA_AVAILABLE:
+            return WebScrapingService._extract_with_trafilatura(html, url)
+        elif BEAUTIFULSOUP_AVAILABLE:
+            return WebScrapingService._extract_with_beautifulsoup(html, url)
+        
+        logger.error("No content extraction method available")
+        return None
+    
+    def _build_document(self, url: str, content: Optional[Dict[str, str]]) -> Optional[Dict[str, Any]]:
+        """Build a knowledge document from extracted content."""
+        if not content:
+            return None
+        
+        return {
+            "content": content["text"],
+            "metadata": {
+                "source": url,
+                "title": content.get("title", ""),
+                "url": url,
+                "content_length": len(content["text"]),
+                "extraction_method": content.get("method", "unknown"),
+                "file_type": ".html"
+            }
+        }
+    
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        """Get the process pool used for HTML parsing, creating it on first use.
+        
+        Crawls shut the pool down when they finish, so workers do not outlive them.
+        """
+        if self._parse_pool is None:
+            self._parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return self._parse_pool
+    
+    def _submit_parse(self, url: str, pending: Dict[Future, str]):
+        """Fetch a URL and queue its HTML for parsing in the process pool."""
+        try:
+            html = self._fetch_html(url)
+            if html is not None:
+                pending[self._get_parse_pool().submit(self._extract_html, html, url)] = url
+        except Exception as e:
+            logger.error(f"Failed to fetch URL {url}: {e}")
+    
+    def _collect_parsed(self, futures, pending: Dict[Future, str], documents: List[Dict[str, Any]]):
+        """Move finished parse results into the document list."""
+        for future in futures:
+            url = pending.pop(future)
+            try:
+                document = self._build_document(url, future.result())
+            except Exception as e:
+                logger.error(f"Failed to extract content from {url}: {e}")
+                continue
+            
+            if document:
+                documents.append(document)
+                logger.info(f"Extracted content from: {url}")
+    
+    def shutdown(self):
+        """Release the parse process pool."""
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False)
+            self._parse_pool = None
+    
+    def _rejection_reason(self, response) -> Optional[str]:
+        """Return why a response should not be scraped, judging by its headers only."""
+        content_type = response.headers.get('content-type', '').lower()
+        if content_type and not content_type.startswith(('text/html', 'application/xhtml+xml')):
+            return f"non-HTML content ({content_type})"
+        
+        try:
+            content_length = int(response.headers.get('content-length', '0'))
+        except ValueError:
+            content_length = 0
+        
+        if content_length > self.max_content_bytes:
+            return f"large response ({content_length} bytes)"
+        
+        return None
+    
+    def _is_scrapable_response(self, response) -> bool:
+        """Check response headers before downloading the body."""
+        reason = self._rejection_reason(response)
+        if reason:
+            logger.info(f"Skipping {reason}: {response.url}")
+            return False
+        
+        return True
+    
+    def _is_cacheable_response(self, response) -> bool:
+        """Cache filter that keeps only responses that would be scraped."""
+        return self._rejection_reason(response) is None
+    
+    @staticmethod
+    def _extract_with_trafilatura(html: str, url: str) -> Optional[Dict[str, str]]:
         """Extract content using trafilatura."""
         try:
+            import trafilatura
+            
             # Extract main content
             text = trafilatura.extract(html, include_comments=False, include_tables=True)
             
@@ -140,9 +260,12 @@ class WebScrapingService:
             logger.error(f"Trafilatura extraction failed: {e}")
             return None
     
-    def _extract_with_beautifulsoup(self, html: str, url: str) -> Optional[Dict[str, str]]:
+    @staticmethod
+    def _extract_with_beautifulsoup(html: str, url: str) -> Optional[Dict[str, str]]:
         """Extract content using BeautifulSoup."""
         try:
+            from bs4 import BeautifulSoup
+            
             soup = BeautifulSoup(html, 'html.parser')
             
             # Extract title
@@ -189,6 +312,7 @@ class WebScrapingService:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
+            from bs4 import BeautifulSoup
             soup = BeautifulSoup(response.text, 'html.parser')
             links = []
             
@@ -236,44 +360,92 @@ class WebScrapingService:
             return []
         
         documents = []
+        
+        # Pages are fetched by the URL as linked; canonical forms only detect repeats
         visited_urls: Set[str] = set()
-        urls_to_visit = [start_url]
+        urls_to_visit = deque([start_url])
+        queued_urls: Set[str] = {self._canonicalize_url(start_url)}
         
         logger.info(f"Starting website crawl from: {start_url} (max {max_pages} pages)")
         
-        while urls_to_visit and len(documents) < max_pages:
-            current_url = urls_to_visit.pop(0)
-            
-            if current_url in visited_urls:
-                continue
-            
-            visited_urls.add(current_url)
-            
-            # Extract content from current page
-            content = self.extract_content_from_url(current_url)
-            if content:
-                documents.append(content)
-                logger.info(f"Extracted content from: {current_url}")
-            
-            # Find more links if we haven't reached the limit
-            if len(documents) < max_pages:
-                try:
-                    links = self.extract_links_from_page(current_url, same_domain_only)
-                    
-                    # Add new links to visit
-                    for link in links:
-                        if link not in visited_urls and link not in urls_to_visit:
-                            urls_to_visit.append(link)
-                    
-                    # Rate limiting
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    logger.error(f"Failed to extract links from {current_url}: {e}")
+        pending: Dict[Future, str] = {}
+        
+        try:
+            # Pages are parsed in the process pool while the next ones are fetched
+            while len(documents) < max_pages and (urls_to_visit or pending):
+                self._collect_parsed([f for f in pending if f.done()], pending, documents)
+                
+                # Wait for in-flight parses when nothing else can be fetched yet
+                if pending and (not urls_to_visit or len(documents) + len(pending) >= max_pages):
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    self._collect_parsed(done, pending, documents)
+                    continue
+                
+                if not urls_to_visit or len(documents) >= max_pages:
+                    break
+                
+                current_url = urls_to_visit.popleft()
+                current_key = self._canonicalize_url(current_url)
+                
+                if current_key in visited_urls:
+                    continue
+                
+                visited_urls.add(current_key)
+                
+                # Extract content from current page
+                self._submit_parse(current_url, pending)
+                
+                # Find more links if we haven't reached the limit; parses still
+                # pending may yield nothing, so only finished documents count
+                if len(documents) < max_pages:
+                    try:
+                        links = self.extract_links_from_page(current_url, same_domain_only)
+                        
+                        # Add new links to visit
+                        for link in links:
+                            link_key = self._canonicalize_url(link)
+                            if link_key not in visited_urls and link_key not in queued_urls:
+                                urls_to_visit.append(link)
+                                queued_urls.add(link_key)
+                        
+                        # Rate limiting
+                        time.sleep(1)
+                        
+                    except Exception as e:
+                        logger.error(f"Failed to extract links from {current_url}: {e}")
+        finally:
+            # Release the parse workers; the next crawl starts a new pool
+            self.shutdown()
         
         logger.info(f"Website crawl completed. Extracted {len(documents)} documents.")
         return documents
     
+    def _canonicalize_url(self, url: str) -> str:
+        """Normalize a URL so fragment, tracking-query and trailing-slash variants compare equal.
+        
+        Only a deduplication key; requests and link resolution use the original URL.
+        """
+        parsed = urlparse(url)
+        
+        # Drop tracking parameters, keep the rest in their original order
+        query = urlencode([
+            (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+            if not key.lower().startswith('utm_') and key.lower() not in ('fbclid', 'gclid')
+        ])
+        
+        path = parsed.path or '/'
+        if len(path) > 1 and path.endswith('/'):
+            path = path.rstrip('/') or '/'
+        
+        return urlunparse((
+            parsed.scheme.lower(),
+            parsed.netloc.lower(),
+            path,
+            parsed.params,
+            query,
+            ''
+        ))
+    
     def extract_from_sitemap(self, sitemap_url: str, max_urls: int = 50) -> List[Dict[str, Any]]:
         """Extract content from URLs listed in a sitemap."""
         if not self.is_available():
@@ -288,6 +460,7 @@ class WebScrapingService:
             response.raise_for_status()
             
             # Parse sitemap XML
+            from bs4 import BeautifulSoup
             soup = BeautifulSoup(response.text, 'xml')
             urls = []
             
@@ -302,20 +475,17 @@ class WebScrapingService:
             # Limit URLs
             urls = urls[:max_urls]
             
-            # Extract content from each URL
+            # Extract content from each URL, parsing in the process pool while fetching
             documents = []
+            pending: Dict[Future, str] = {}
             for url in urls:
-                try:
-                    content = self.extract_content_from_url(url)
-                    if content:
-                        documents.append(content)
-                    
-                    # Rate limiting
-                    time.sleep(0.5)
-                    
-                except Exception as e:
-                    logger.error(f"Failed to extract from {url}: {e}")
-                    continue
+                self._submit_parse(url, pending)
+                self._collect_parsed([f for f in pending if f.done()], pending, documents)
+                
+                # Rate limiting
+                time.sleep(0.5)
+            
+            self._collect_parsed(list(pending), pending, documents)
             
             logger.info(f"Extracted {len(documents)} documents from sitemap")
             return documents
@@ -323,6 +493,8 @@ class WebScrapingService:
         except Exception as e:
             logger.error(f"Failed to process sitemap {sitemap_url}: {e}")
             return []
+        finally:
+            self.shutdown()
     
     def validate_url(self, url: str) -> bool:
         """Validate if a URL is accessible."""
@@ -4,12 +4,16 @@ Workspace Service
 Manages workspaces, multi-workspace support, and workspace operations.
 """
 
+import hashlib
 import json
+import os
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from loguru import logger
 
+from pydantic import BaseModel
+
 from models.workspace import Workspace, WorkspaceType, EnhancedGemConfiguration
 from services.config_service import ConfigService
 
@@ -22,6 +26,9 @@ class WorkspaceService:
         self.workspaces_dir = config_service.get_app_directory() / "workspaces"
         self.configurations_dir = config_service.get_app_directory() / "configurations"
         
+        # Content digests of files on disk, keyed by path: (mtime_ns, digest)
+        self._file_digests: Dict[Path, Tuple[int, str]] = {}
+        
         # Create directories
         self.workspaces_dir.mkdir(exist_ok=True)
         self.configurations_dir.mkdir(exist_ok=True)
@@ -48,11 +55,11 @@ class WorkspaceService:
         """Save a workspace to file."""
         try:
             workspace_file = self.workspaces_dir / f"{workspace.id}.json"
-            workspace.modified_at = datetime.now()
             
-            with open(workspace_file, 'w', encoding='utf-8') as f:
-                json.dump(workspace.model_dump(), f, indent=2, default=str)
-            logger.info(f"Workspace '{workspace.name}' saved")
+            if self._write_model(workspace, workspace_file):
+                logger.info(f"Workspace '{workspace.name}' saved")
+            else:
+                logger.debug(f"Workspace '{workspace.name}' unchanged, skipped write")
             return True
         except Exception as e:
             logger.error(f"Failed to save workspace: {e}")
@@ -108,6 +115,7 @@ class WorkspaceService:
             workspace_file = self.workspaces_dir / f"{workspace_id}.json"
             if workspace_file.exists():
                 workspace_file.unlink()
+                self._file_digests.pop(workspace_file, None)
                 logger.info(f"Workspace '{workspace_id}' deleted")
                 return True
             else:
@@ -145,11 +153,11 @@ class WorkspaceService:
         """Save an enhanced configuration to file."""
         try:
             config_file = self.configurations_dir / f"{config.id}.json"
-            config.modified_at = datetime.now()
             
-            with open(config_file, 'w', encoding='utf-8') as f:
-                json.dump(config.model_dump(), f, indent=2, default=str)
-            logger.info(f"Configuration '{config.name}' saved")
+            if self._write_model(config, config_file):
+                logger.info(f"Configuration '{config.name}' saved")
+            else:
+                logger.debug(f"Configuration '{config.name}' unchanged, skipped write")
             return True
         except Exception as e:
             logger.error(f"Failed to save configuration: {e}")
@@ -175,6 +183,7 @@ class WorkspaceService:
         configurations = []
         
         try:
+            workspace = self.load_workspace(workspace_id) if workspace_id is not None else None
             config_files = list(self.configurations_dir.glob("*.json"))
             
             for config_file in config_files:
@@ -188,7 +197,6 @@ class WorkspaceService:
                         configurations.append(config)
                     else:
                         # Check if configuration is in the specified workspace
-                        workspace = self.load_workspace(workspace_id)
                         if workspace and config.id in workspace.configurations:
                             configurations.append(config)
                             
@@ -300,7 +308,11 @@ class WorkspaceService:
             if not workspace:
                 return {}
             
-            configurations = self.list_configurations(workspace_id)
+            # Load only the member configurations instead of scanning every file
+            configurations = [
+                config for config_id in workspace.configurations
+                if (config := self.load_configuration(config_id))
+            ]
             
             total_messages = sum(config.total_messages for config in configurations)
             total_usage = sum(config.usage_count for config in configurations)
@@ -329,3 +341,49 @@ class WorkspaceService:
         """Check if a workspace exists."""
         workspace_file = self.workspaces_dir / f"{workspace_id}.json"
         return workspace_file.exists()
+    
+    def _write_model(self, model: BaseModel, file_path: Path) -> bool:
+        """Atomically write a model as JSON, skipping the write if its content is unchanged.
+        
+        Returns True if the file was written. ``modified_at`` is only bumped on an actual write.
+        """
+        digest = self._content_digest(model.model_dump())
+        if digest == self._stored_digest(file_path):
+            return False
+        
+        model.modified_at = datetime.now()
+        
+        temp_file = file_path.with_suffix('.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(model.model_dump(), f, indent=2, default=str)
+        os.replace(temp_file, file_path)
+        
+        self._file_digests[file_path] = (file_path.stat().st_mtime_ns, digest)
+        return True
+    
+    def _stored_digest(self, file_path: Path) -> Optional[str]:
+        """Get the content digest of a file on disk, reusing the cached value if unmodified."""
+        try:
+            mtime_ns = file_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        
+        cached = self._file_digests.get(file_path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                digest = self._content_digest(json.load(f))
+        except Exception:
+            return None
+        
+        self._file_digests[file_path] = (mtime_ns, digest)
+        return digest
+    
+    @staticmethod
+    def _content_digest(data: Dict[str, Any]) -> str:
+        """Hash serialized content, ignoring the modification timestamp."""
+        content = {key: value for key, value in data.items() if key != "modified_at"}
+        payload = json.dumps(content, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
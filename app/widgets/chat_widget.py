@@ -5,14 +5,285 @@ Widget for displaying chat conversation and handling user input.
 """
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, 
+    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QListView,
     QPushButton, QGroupBox, QSplitter, QLabel,
-    QScrollArea, QFrame
+    QScrollArea, QFrame, QStyledItemDelegate, QAbstractItemView,
+    QApplication, QMenu, QStyle
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QThread, pyqtSlot
-from PyQt6.QtGui import QFont, QTextCursor
+from PyQt6.QtCore import Qt, QEvent, QAbstractListModel, QModelIndex, QSize, pyqtSignal
+from PyQt6.QtGui import QAction, QFont, QFontMetrics, QKeySequence, QTextDocument
 from loguru import logger
+from collections import OrderedDict, deque
 from datetime import datetime
+from types import MappingProxyType
+from typing import List, Mapping, Optional
+
+
+# Message HTML envelopes, filled with {timestamp} and {content}.
+# Content is pre-wrapped plain text, so line breaks need no <br> elements.
+_USER_TMPL = (
+    "<b style='color: #2196F3;'>[{timestamp}] You:</b><br>"
+    "<span style='background-color: #f5f5f5; white-space: pre-wrap;'>{content}</span>"
+)
+_ASSISTANT_TMPL = (
+    "<b style='color: #4CAF50;'>[{timestamp}] Assistant:</b><br>"
+    "<span style='background-color: #e8f5e8; white-space: pre-wrap;'>{content}</span>"
+)
+_SYSTEM_TMPL = "<i style='color: #666; white-space: pre-wrap;'>[{timestamp}] System: {content}</i>"
+_ERROR_TMPL = (
+    "<b style='color: #f44336;'>[{timestamp}] Error:</b><br>"
+    "<span style='background-color: #ffebee; color: #c62828; white-space: pre-wrap;'>{content}</span>"
+)
+
+# Escapes markup characters in a single pass. Newlines become line separators,
+# which the pre-wrapped content lays out as line breaks.
+_HTML_TRANSLATION = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '\n': '\u2028',
+})
+
+_MESSAGE_TEMPLATES = {
+    "user": _USER_TMPL,
+    "assistant": _ASSISTANT_TMPL,
+    "system": _SYSTEM_TMPL,
+    "error": _ERROR_TMPL,
+}
+
+# Roles that are part of the conversation history (the others are display-only)
+_HISTORY_ROLES = frozenset({"user", "assistant"})
+
+
+class ChatMessage:
+    """Compact chat history record.
+    
+    Uses __slots__ instead of a per-message dict, which keeps long sessions small.
+    """
+    
+    __slots__ = ("role", "content", "timestamp", "html", "height", "layout_width", "_mapping")
+    
+    def __init__(self, role: str, content: str, timestamp: str = ""):
+        self.role = role
+        self.content = content
+        self.timestamp = timestamp
+        self.html: Optional[str] = None  # Display HTML, built on first render
+        self.height = 0  # Row height, valid while layout_width matches the view
+        self.layout_width = 0
+        self._mapping: Optional[Mapping[str, str]] = None
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "ChatMessage":
+        """Create a message from a {"role", "content", "timestamp"} dict."""
+        return cls(data.get("role", "unknown"), data.get("content", ""), data.get("timestamp", ""))
+    
+    def to_dict(self) -> dict:
+        """Convert to the dict form used by sessions and the API service."""
+        return {"role": self.role, "content": self.content, "timestamp": self.timestamp}
+    
+    def as_mapping(self) -> Mapping[str, str]:
+        """Read-only dict view of the message, built once and shared between callers."""
+        if self._mapping is None:
+            self._mapping = MappingProxyType(self.to_dict())
+        return self._mapping
+
+
+def _render_message_html(message: ChatMessage) -> str:
+    """Build the display HTML for a message, cached on the message."""
+    if message.html is None:
+        message.html = _MESSAGE_TEMPLATES.get(message.role, _SYSTEM_TMPL).format_map({
+            "timestamp": message.timestamp,
+            "content": message.content.translate(_HTML_TRANSLATION)
+        })
+    return message.html
+
+
+def _history_key(message: ChatMessage) -> tuple:
+    """Identify a displayed message by what it shows."""
+    return (message.role, message.content, message.timestamp)
+
+
+def _current_timestamp() -> str:
+    """Format the current time as HH:MM:SS without going through strftime."""
+    now = datetime.now()
+    return f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}"
+
+
+class ChatModel(QAbstractListModel):
+    """List model of the displayed chat messages, oldest first.
+    
+    Holds at most max_rows messages; the oldest rows are dropped past the cap.
+    """
+    
+    def __init__(self, max_rows: int = 1000, parent=None):
+        super().__init__(parent)
+        self.max_rows = max_rows
+        self.messages: List[ChatMessage] = []
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Number of displayed messages."""
+        return 0 if parent.isValid() else len(self.messages)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """HTML for DisplayRole, the ChatMessage itself for UserRole."""
+        if not index.isValid():
+            return None
+        
+        message = self.messages[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return _render_message_html(message)
+        if role == Qt.ItemDataRole.UserRole:
+            return message
+        return None
+    
+    def append_message(self, message: ChatMessage):
+        """Append a message, dropping the oldest rows past the cap."""
+        row = len(self.messages)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.messages.append(message)
+        self.endInsertRows()
+        self._enforce_max_rows()
+    
+    def replace_tail(self, keep: int, messages: List[ChatMessage]):
+        """Keep the first `keep` rows and replace everything after them with messages."""
+        if keep < len(self.messages):
+            self.beginRemoveRows(QModelIndex(), keep, len(self.messages) - 1)
+            del self.messages[keep:]
+            self.endRemoveRows()
+        
+        if messages:
+            self.beginInsertRows(QModelIndex(), keep, keep + len(messages) - 1)
+            self.messages.extend(messages)
+            self.endInsertRows()
+        self._enforce_max_rows()
+    
+    def message_changed(self, message: ChatMessage) -> QModelIndex:
+        """Notify views that a message's content changed; returns its index."""
+        message.html = None
+        message.layout_width = 0
+        
+        # Updated messages are almost always among the newest rows
+        for row in range(len(self.messages) - 1, -1, -1):
+            if self.messages[row] is message:
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+                return index
+        return QModelIndex()
+    
+    def clear(self):
+        """Remove all rows."""
+        self.beginResetModel()
+        self.messages = []
+        self.endResetModel()
+    
+    def set_max_rows(self, max_rows: int):
+        """Set the row cap, dropping the oldest rows if needed."""
+        self.max_rows = max_rows
+        self._enforce_max_rows()
+    
+    def _enforce_max_rows(self):
+        """Drop the oldest rows beyond max_rows."""
+        excess = len(self.messages) - self.max_rows
+        if excess > 0:
+            self.beginRemoveRows(QModelIndex(), 0, excess - 1)
+            del self.messages[:excess]
+            self.endRemoveRows()
+
+
+class ChatDelegate(QStyledItemDelegate):
+    """Paints one chat message per row from a per-message QTextDocument.
+    
+    Documents are built only for painted rows and kept in a small LRU cache. Row
+    heights are estimated from font metrics and cached on the message, then
+    corrected from the real layout once the row is painted.
+    """
+    
+    DOCUMENT_CACHE_SIZE = 200
+    DOCUMENT_MARGIN = 4
+    
+    def __init__(self, view: QListView):
+        super().__init__(view)
+        self.view = view
+        self._documents: "OrderedDict[ChatMessage, tuple]" = OrderedDict()
+    
+    def paint(self, painter, option, index):
+        """Draw the message document at the row's position."""
+        document = self._document(index, option.rect.width())
+        
+        # Row background, including the selection highlight
+        self.view.style().drawPrimitive(
+            QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, self.view
+        )
+        
+        painter.save()
+        painter.setClipRect(option.rect)
+        painter.translate(option.rect.topLeft())
+        document.drawContents(painter)
+        painter.restore()
+        
+        # Replace the estimate with the real height now that the row is laid out
+        message = index.data(Qt.ItemDataRole.UserRole)
+        height = int(document.size().height())
+        if message.layout_width == option.rect.width() and message.height != height:
+            message.height = height
+            self.sizeHintChanged.emit(index)
+    
+    def sizeHint(self, option, index) -> QSize:
+        """Size of the message at the viewport width, without laying it out."""
+        return QSize(self.view.viewport().width(), self.row_height(index))
+    
+    def row_height(self, index: QModelIndex) -> int:
+        """Cached row height for the current viewport width."""
+        message = index.data(Qt.ItemDataRole.UserRole)
+        width = self.view.viewport().width()
+        if message.layout_width != width:
+            message.height = self._estimate_height(message, width)
+            message.layout_width = width
+        return message.height
+    
+    def _estimate_height(self, message: ChatMessage, width: int) -> int:
+        """Estimate a row's height from the wrapped line count of its content."""
+        metrics = QFontMetrics(self.view.font())
+        columns = max(1, (width - 2 * self.DOCUMENT_MARGIN) // max(1, metrics.averageCharWidth()))
+        
+        # System messages share their line with the header; the others start below it
+        if message.role == "system":
+            lines = 0
+            text = f"[{message.timestamp}] System: {message.content}"
+        else:
+            lines = 1
+            text = message.content
+        
+        for line in text.split("\n"):
+            lines += max(1, -(-len(line) // columns))
+        
+        return lines * metrics.lineSpacing() + 2 * self.DOCUMENT_MARGIN
+    
+    def clear_cache(self):
+        """Drop all cached documents."""
+        self._documents.clear()
+    
+    def _document(self, index: QModelIndex, width: int) -> QTextDocument:
+        """Get the laid-out document for a row, building it if the HTML changed."""
+        message = index.data(Qt.ItemDataRole.UserRole)
+        html = index.data(Qt.ItemDataRole.DisplayRole)
+        
+        cached = self._documents.get(message)
+        if cached is not None and cached[0] is html:
+            document = cached[1]
+            self._documents.move_to_end(message)
+        else:
+            document = QTextDocument()
+            document.setDefaultFont(self.view.font())
+            document.setDocumentMargin(self.DOCUMENT_MARGIN)
+            document.setHtml(html)
+            self._documents[message] = (html, document)
+            if len(self._documents) > self.DOCUMENT_CACHE_SIZE:
+                self._documents.popitem(last=False)
+        
+        if document.textWidth() != width:
+            document.setTextWidth(width)
+        return document
 
 
 class ChatWidget(QWidget):
@@ -20,11 +291,22 @@ class ChatWidget(QWidget):
     
     message_sent = pyqtSignal(str)
     
-    def __init__(self, parent=None):
+    _ENTER_KEYS = frozenset({Qt.Key.Key_Return.value, Qt.Key.Key_Enter.value})
+    
+    def __init__(self, parent=None, max_messages: int = 1000, history_capacity: int = 10_000):
         super().__init__(parent)
-        self.chat_history = []
-        self.init_ui()
+        self.chat_history = deque(maxlen=history_capacity)
+        self._history_mappings = deque(maxlen=history_capacity)  # as_mapping() of each history entry
+        self._history_snapshot: Optional[tuple] = None  # Shared by get_chat_history until changed
+        self.max_messages = max_messages
+        
+        # Streaming state: the assistant message currently being generated
+        self._streaming_message: Optional[ChatMessage] = None
+        self._streaming_parts: list = []
+        self._last_stream_height = 0  # Row height when the stream last relaid out
         
+        self.init_ui()
+    
     def init_ui(self):
         """Initialize the user interface."""
         layout = QVBoxLayout(self)
@@ -37,16 +319,29 @@ class ChatWidget(QWidget):
         splitter = QSplitter(Qt.Orientation.Vertical)
         group_layout.addWidget(splitter)
         
-        # Chat display area
-        self.chat_display = QTextEdit()
-        self.chat_display.setReadOnly(True)
+        # Chat display area: one row per message, only visible rows are laid out
+        self.chat_model = ChatModel(self.max_messages, self)
+        self.chat_display = QListView()
+        self.chat_display.setModel(self.chat_model)
+        self.chat_delegate = ChatDelegate(self.chat_display)
+        self.chat_display.setItemDelegate(self.chat_delegate)
+        self.chat_display.setUniformItemSizes(False)
+        self.chat_display.setResizeMode(QListView.ResizeMode.Adjust)
+        self.chat_display.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.chat_display.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.chat_display.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.chat_display.setFont(QFont("Consolas", 10))
-        self.chat_display.setPlaceholderText(
-            "Chat conversation will appear here...\n\n"
-            "Enter your message below and click 'Send' or press Ctrl+Enter to start chatting."
-        )
         splitter.addWidget(self.chat_display)
         
+        # Selected messages are copied whole, via Ctrl+C or the context menu
+        self.copy_action = QAction("Copy", self.chat_display)
+        self.copy_action.setShortcut(QKeySequence.StandardKey.Copy)
+        self.copy_action.setShortcutContext(Qt.ShortcutContext.WidgetShortcut)
+        self.copy_action.triggered.connect(self.copy_selected_messages)
+        self.chat_display.addAction(self.copy_action)
+        self.chat_display.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.chat_display.customContextMenuRequested.connect(self.show_context_menu)
+        
         # Input area
         input_widget = self.create_input_area()
         splitter.addWidget(input_widget)
@@ -96,13 +391,32 @@ class ChatWidget(QWidget):
         
         return input_widget
     
+    def show_context_menu(self, position):
+        """Show context menu for the chat display."""
+        if not self.chat_display.indexAt(position).isValid():
+            return
+        
+        menu = QMenu(self)
+        menu.addAction(self.copy_action)
+        menu.exec(self.chat_display.mapToGlobal(position))
+    
+    def copy_selected_messages(self):
+        """Copy the text of the selected messages to the clipboard, oldest first."""
+        rows = sorted(index.row() for index in self.chat_display.selectionModel().selectedIndexes())
+        if not rows:
+            return
+        
+        messages = self.chat_model.messages
+        QApplication.clipboard().setText("\n\n".join(messages[row].content for row in rows))
+    
     def eventFilter(self, obj, event):
         """Handle keyboard events for input text area."""
-        if obj == self.input_text and event.type() == event.Type.KeyPress:
-            if event.key() == Qt.Key.Key_Return or event.key() == Qt.Key.Key_Enter:
-                if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
-                    self.send_message()
-                    return True
+        if (obj is self.input_text
+                and event.type() == QEvent.Type.KeyPress
+                and event.key() in self._ENTER_KEYS
+                and event.modifiers() & Qt.KeyboardModifier.ControlModifier):
+            self.send_message()
+            return True
         return super().eventFilter(obj, event)
     
     def send_message(self):
@@ -124,47 +438,65 @@ class ChatWidget(QWidget):
         self.send_button.setEnabled(False)
         self.stop_button.setEnabled(True)
         
-        logger.info(f"Message sent: {message[:50]}...")
+        # Lazy so the preview is only built when an INFO sink is active
+        logger.opt(lazy=True).info("Message sent: {}...", lambda: message[:50])
     
     def add_user_message(self, message: str):
         """Add a user message to the chat display."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        
-        self.chat_display.append(f"<div style='margin-bottom: 10px;'>")
-        self.chat_display.append(f"<b style='color: #2196F3;'>[{timestamp}] You:</b>")
-        self.chat_display.append(f"<div style='margin-left: 20px; background-color: #f5f5f5; padding: 8px; border-radius: 5px;'>")
-        self.chat_display.append(message.replace('\n', '<br>'))
-        self.chat_display.append(f"</div></div>")
-        
-        # Scroll to bottom
-        self.scroll_to_bottom()
+        entry = ChatMessage("user", message, _current_timestamp())
+        self._append_message(entry, always_scroll=True)
         
         # Add to history
-        self.chat_history.append({
-            "role": "user",
-            "content": message,
-            "timestamp": timestamp
-        })
+        self._record_history(entry)
     
     def add_assistant_message(self, message: str):
         """Add an assistant message to the chat display."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        entry = ChatMessage("assistant", message, _current_timestamp())
+        self._append_message(entry)
         
-        self.chat_display.append(f"<div style='margin-bottom: 10px;'>")
-        self.chat_display.append(f"<b style='color: #4CAF50;'>[{timestamp}] Assistant:</b>")
-        self.chat_display.append(f"<div style='margin-left: 20px; background-color: #e8f5e8; padding: 8px; border-radius: 5px;'>")
-        self.chat_display.append(message.replace('\n', '<br>'))
-        self.chat_display.append(f"</div></div>")
+        # Add to history
+        self._record_history(entry)
         
-        # Scroll to bottom
-        self.scroll_to_bottom()
+        # Update UI state
+        self.send_button.setEnabled(True)
+        self.stop_button.setEnabled(False)
+    
+    def append_assistant_chunk(self, text: str):
+        """Append a streamed chunk to the assistant message being generated.
+        
+        The message row is created on the first chunk and updated in place.
+        Call finish_assistant_message() once the stream ends.
+        """
+        at_bottom = self._is_scrolled_to_bottom()
+        
+        if self._streaming_message is None:
+            self._streaming_message = ChatMessage("assistant", "", _current_timestamp())
+            self._streaming_parts = []
+            self._last_stream_height = 0
+            self._append_message(self._streaming_message)
+        
+        self._streaming_parts.append(text)
+        self._streaming_message.content = "".join(self._streaming_parts)
+        index = self.chat_model.message_changed(self._streaming_message)
+        if not index.isValid():
+            return  # Row already dropped by the message cap
+        
+        # Only relayout and scroll when the chunk actually grew the row
+        height = self.chat_delegate.row_height(index)
+        if height != self._last_stream_height:
+            self._last_stream_height = height
+            self.chat_delegate.sizeHintChanged.emit(index)
+            if at_bottom:
+                self.scroll_to_bottom()
+    
+    def finish_assistant_message(self):
+        """Finalize the streamed assistant message and record it in the history."""
+        if self._streaming_message is None:
+            return
         
-        # Add to history
-        self.chat_history.append({
-            "role": "assistant",
-            "content": message,
-            "timestamp": timestamp
-        })
+        self._record_history(self._streaming_message)
+        self._streaming_message = None
+        self._streaming_parts = []
         
         # Update UI state
         self.send_button.setEnabled(True)
@@ -172,78 +504,103 @@ class ChatWidget(QWidget):
     
     def add_system_message(self, message: str):
         """Add a system message to the chat display."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        
-        self.chat_display.append(f"<div style='margin-bottom: 10px;'>")
-        self.chat_display.append(f"<i style='color: #666;'>[{timestamp}] System: {message}</i>")
-        self.chat_display.append(f"</div>")
-        
-        # Scroll to bottom
-        self.scroll_to_bottom()
+        self._append_message(ChatMessage("system", message, _current_timestamp()))
     
     def add_error_message(self, message: str):
         """Add an error message to the chat display."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        
-        self.chat_display.append(f"<div style='margin-bottom: 10px;'>")
-        self.chat_display.append(f"<b style='color: #f44336;'>[{timestamp}] Error:</b>")
-        self.chat_display.append(f"<div style='margin-left: 20px; background-color: #ffebee; padding: 8px; border-radius: 5px; color: #c62828;'>")
-        self.chat_display.append(message.replace('\n', '<br>'))
-        self.chat_display.append(f"</div></div>")
-        
-        # Scroll to bottom
-        self.scroll_to_bottom()
+        self._append_message(ChatMessage("error", message, _current_timestamp()))
         
         # Update UI state
         self.send_button.setEnabled(True)
         self.stop_button.setEnabled(False)
     
+    def _append_message(self, message: ChatMessage, always_scroll: bool = False):
+        """Append one message row to the chat display.
+        
+        The view follows new messages only if it was already at the bottom, so reading
+        older messages is not interrupted, unless always_scroll is set.
+        """
+        at_bottom = self._is_scrolled_to_bottom()
+        
+        self.chat_model.append_message(message)
+        
+        if at_bottom or always_scroll:
+            self.scroll_to_bottom()
+    
+    def set_max_messages(self, max_messages: int):
+        """Set the maximum number of messages kept in the chat display."""
+        self.max_messages = max_messages
+        self.chat_model.set_max_rows(max_messages)
+    
+    def _is_scrolled_to_bottom(self) -> bool:
+        """Check whether the chat display is scrolled to the bottom."""
+        scrollbar = self.chat_display.verticalScrollBar()
+        return scrollbar.value() >= scrollbar.maximum()
+    
     def scroll_to_bottom(self):
         """Scroll the chat display to the bottom."""
-        cursor = self.chat_display.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        self.chat_display.setTextCursor(cursor)
+        self.chat_display.scrollToBottom()
     
     def clear_chat(self):
         """Clear the chat display and history."""
-        self.chat_display.clear()
+        self.chat_model.clear()
+        self.chat_delegate.clear_cache()
         self.chat_history.clear()
+        self._history_mappings.clear()
+        self._history_snapshot = None
+        self._streaming_message = None
+        self._streaming_parts = []
         self.add_system_message("Chat cleared.")
         logger.info("Chat cleared")
     
     def stop_generation(self):
         """Stop the current generation."""
         # TODO: Implement stop generation logic
+        self.finish_assistant_message()
         self.add_system_message("Generation stopped.")
         self.send_button.setEnabled(True)
         self.stop_button.setEnabled(False)
         logger.info("Generation stopped")
     
-    def get_chat_history(self) -> list:
-        """Get the chat history."""
-        return self.chat_history.copy()
+    def _record_history(self, entry: ChatMessage):
+        """Append a message to the history."""
+        self.chat_history.append(entry)
+        self._history_mappings.append(entry.as_mapping())
+        self._history_snapshot = None
+    
+    def get_chat_history(self) -> tuple:
+        """Get the chat history as a read-only tuple of read-only message mappings.
+        
+        Each message's mapping is built once, so a new snapshot only copies references.
+        The tuple is shared between calls until the history changes.
+        """
+        if self._history_snapshot is None:
+            self._history_snapshot = tuple(self._history_mappings)
+        return self._history_snapshot
     
     def set_chat_history(self, history: list):
-        """Set the chat history and update display."""
-        self.chat_history = history.copy()
-        self.chat_display.clear()
-        
-        for entry in self.chat_history:
-            role = entry.get("role", "unknown")
-            content = entry.get("content", "")
-            timestamp = entry.get("timestamp", "")
-            
-            if role == "user":
-                self.chat_display.append(f"<div style='margin-bottom: 10px;'>")
-                self.chat_display.append(f"<b style='color: #2196F3;'>[{timestamp}] You:</b>")
-                self.chat_display.append(f"<div style='margin-left: 20px; background-color: #f5f5f5; padding: 8px; border-radius: 5px;'>")
-                self.chat_display.append(content.replace('\n', '<br>'))
-                self.chat_display.append(f"</div></div>")
-            elif role == "assistant":
-                self.chat_display.append(f"<div style='margin-bottom: 10px;'>")
-                self.chat_display.append(f"<b style='color: #4CAF50;'>[{timestamp}] Assistant:</b>")
-                self.chat_display.append(f"<div style='margin-left: 20px; background-color: #e8f5e8; padding: 8px; border-radius: 5px;'>")
-                self.chat_display.append(content.replace('\n', '<br>'))
-                self.chat_display.append(f"</div></div>")
+        """Set the chat history and update display.
+        
+        Rows already showing the leading messages of the new history are kept, and
+        only the rows after them are replaced.
+        """
+        maxlen = self.chat_history.maxlen
+        self.chat_history = deque(
+            (entry if isinstance(entry, ChatMessage) else ChatMessage.from_dict(entry)
+             for entry in history[-maxlen:]),
+            maxlen=maxlen
+        )
+        self._history_mappings = deque((entry.as_mapping() for entry in self.chat_history), maxlen=maxlen)
+        self._history_snapshot = None
+        
+        displayed = [entry for entry in self.chat_history if entry.role in _HISTORY_ROLES]
+        displayed = displayed[-self.max_messages:]
+        
+        keep = 0
+        for row_message, entry in zip(self.chat_model.messages, displayed):
+            if row_message.role not in _HISTORY_ROLES or _history_key(row_message) != _history_key(entry):
+                break
+            keep += 1
         
+        self.chat_model.replace_tail(keep, displayed[keep:])
         self.scroll_to_bottom()
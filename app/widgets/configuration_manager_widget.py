@@ -6,16 +6,202 @@ Advanced configuration management interface for Epic 5.
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
-    QListWidget, QListWidgetItem, QPushButton, QLabel,
+    QListWidget, QListWidgetItem, QListView, QPushButton, QLabel,
     QLineEdit, QTextEdit, QComboBox, QGroupBox,
-    QSplitter, QTreeWidget, QTreeWidgetItem, QDialog,
-    QFormLayout, QSpinBox, QCheckBox, QMessageBox,
-    QFileDialog, QProgressBar, QTableWidget, QTableWidgetItem
+    QSplitter, QFormLayout
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
-from PyQt6.QtGui import QIcon, QColor, QFont
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QTimer, QAbstractListModel, QAbstractTableModel, QModelIndex,
+    QSortFilterProxyModel
+)
+from PyQt6.QtGui import QIcon, QColor, QFont, QTextDocument
 from loguru import logger
-from typing import List, Dict, Any, Optional
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+import hashlib
+import json
+import os
+from typing import List, Dict, Any, Optional, Tuple
+
+
+@contextmanager
+def _frozen(widget: QWidget):
+    """Suspend repaints and signals of a widget while it is rebuilt."""
+    widget.setUpdatesEnabled(False)
+    widget.blockSignals(True)
+    try:
+        yield
+    finally:
+        widget.blockSignals(False)
+        widget.setUpdatesEnabled(True)
+        widget.update()
+
+
+class ConfigurationListModel(QAbstractListModel):
+    """List model over configurations, stored as parallel per-field arrays."""
+    
+    _SHARED_ICON: Optional[QIcon] = None  # Created on first use, shared by all rows
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._ids: List[str] = []
+        self._row_by_id: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._lower_names: List[str] = []
+        self._categories: List[str] = []
+        self._workspaces: List[str] = []
+        self._shared: List[bool] = []
+        self._raw: List[Dict[str, Any]] = []
+    
+    def set_configurations(self, configurations: List[Dict[str, Any]]):
+        """Replace the model contents."""
+        ids, names, lower_names, categories, workspaces, shared = [], [], [], [], [], []
+        
+        # Fill all columns in a single pass over the dicts
+        for config in configurations:
+            ids.append(config.get("id", ""))
+            name = config.get("name")
+            names.append(name if name is not None else "Unnamed")
+            lower_names.append(name.lower() if name is not None else "")
+            categories.append(config.get("category"))
+            workspaces.append(config.get("workspace_id"))
+            shared.append(config.get("is_shared", False))
+        
+        self.beginResetModel()
+        self._raw = list(configurations)
+        self._ids = ids
+        self._row_by_id = {config_id: row for row, config_id in enumerate(ids)}
+        self._names = names
+        self._lower_names = lower_names
+        self._categories = categories
+        self._workspaces = workspaces
+        self._shared = shared
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Number of configurations."""
+        return 0 if parent.isValid() else len(self._raw)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Name for DisplayRole, the configuration ID for UserRole."""
+        if not index.isValid():
+            return None
+        
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._names[row]
+        if role == Qt.ItemDataRole.UserRole:
+            return self._ids[row]
+        if role == Qt.ItemDataRole.DecorationRole and self._shared[row]:
+            if ConfigurationListModel._SHARED_ICON is None:
+                ConfigurationListModel._SHARED_ICON = QIcon("shared")  # Would need actual icon
+            return ConfigurationListModel._SHARED_ICON
+        return None
+    
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        """Configurations are selectable but not editable."""
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+    
+    def configuration(self, config_id: str) -> Optional[Dict[str, Any]]:
+        """Get a configuration dict by ID."""
+        row = self._row_by_id.get(config_id)
+        return self._raw[row] if row is not None else None
+    
+    def lower_name(self, row: int) -> str:
+        """Lowercased name of a row, for case-insensitive search."""
+        return self._lower_names[row]
+    
+    def category(self, row: int) -> Optional[str]:
+        """Category of a row."""
+        return self._categories[row]
+    
+    def workspace_id(self, row: int) -> Optional[str]:
+        """Workspace ID of a row."""
+        return self._workspaces[row]
+
+
+class ConfigurationFilterProxyModel(QSortFilterProxyModel):
+    """Filters a ConfigurationListModel by workspace, search text and category."""
+    
+    ALL_CATEGORIES = "All Categories"
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.workspace_id = "default"
+        self.search_text = ""
+        self.category = self.ALL_CATEGORIES
+    
+    def set_filters(self, workspace_id: str, search_text: str, category: str):
+        """Update the filters, re-filtering only if one of them changed."""
+        search_text = search_text.lower()
+        if (workspace_id, search_text, category) == (self.workspace_id, self.search_text, self.category):
+            return
+        
+        self.workspace_id = workspace_id
+        self.search_text = search_text
+        self.category = category
+        self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        """Check a row against the current filters using the model's cached fields."""
+        model = self.sourceModel()
+        
+        if self.workspace_id != "all" and model.workspace_id(source_row) != self.workspace_id:
+            return False
+        
+        if self.search_text and self.search_text not in model.lower_name(source_row):
+            return False
+        
+        if self.category != self.ALL_CATEGORIES and model.category(source_row) != self.category:
+            return False
+        
+        return True
+
+
+class ExportHistoryModel(QAbstractTableModel):
+    """Table model over export history rows of (filename, size, created, type)."""
+    
+    COLUMNS = ["Filename", "Size", "Created", "Type"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Tuple[str, str, str, str]] = []
+    
+    def set_rows(self, rows: List[Tuple[str, str, str, str]]):
+        """Replace all rows."""
+        self.beginResetModel()
+        self._rows = list(rows)
+        self.endResetModel()
+    
+    def append_export(self, row: Tuple[str, str, str, str]):
+        """Append a single export row."""
+        count = len(self._rows)
+        self.beginInsertRows(QModelIndex(), count, count)
+        self._rows.append(row)
+        self.endInsertRows()
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Number of exports."""
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()) -> int:
+        """Number of columns."""
+        return 0 if parent.isValid() else len(self.COLUMNS)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Cell text for DisplayRole."""
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        return self._rows[index.row()][index.column()]
+    
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        """Column titles."""
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.COLUMNS[section]
+        return super().headerData(section, orientation, role)
 
 
 class ConfigurationManagerWidget(QWidget):
@@ -28,14 +214,64 @@ class ConfigurationManagerWidget(QWidget):
     import_requested = pyqtSignal(str)  # file_path
     export_requested = pyqtSignal(list)  # config_ids
     
-    def __init__(self, parent=None):
+    FILTER_DELAY_MS = 150
+    CACHE_SAVE_DELAY_MS = 1000
+    INSTRUCTIONS_CACHE_SIZE = 32
+    
+    _BOLD_FONT: Optional[QFont] = None  # Built-in template font, created on first use
+    
+    # Tab indices
+    CONFIGURATIONS_TAB = 0
+    WORKSPACES_TAB = 1
+    TEMPLATES_TAB = 2
+    IMPORT_EXPORT_TAB = 3
+    
+    def __init__(self, cache_path: Optional[Path] = None, parent=None):
         super().__init__(parent)
+        self.cache_path = cache_path  # No on-disk list cache when None
         self.current_workspace_id = "default"
         self.configurations = []
         self.workspaces = []
         self.templates = []
+        self._workspace_ids_by_name: Dict[str, str] = {}
+        self._last_loaded_id: Optional[str] = None  # Configuration shown in the details form
+        self._data_version = 0  # Bumped on every update_configurations
+        self._last_filter_key: Optional[tuple] = None
+        self._category_counts: Counter = Counter()  # Template category -> template count
+        
+        # Instructions documents by config ID, as (modified_at, document), least recent first
+        self._instructions_documents: "OrderedDict[str, Tuple[Any, QTextDocument]]" = OrderedDict()
+        
+        # List items currently shown and their entries, keyed by workspace/template ID
+        self._workspace_items: Dict[str, QListWidgetItem] = {}
+        self._workspace_entries: Dict[str, Dict[str, Any]] = {}
+        self._template_items: Dict[str, QListWidgetItem] = {}
+        self._template_entries: Dict[str, Dict[str, Any]] = {}
+        
+        self.export_history_model = ExportHistoryModel(self)
+        
+        # Coalesce filter edits so only the last one in a burst is applied
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(self.refresh_configuration_list)
+        self._last_filter = ("", "All Categories")
+        
+        self._template_filter_timer = QTimer(self)
+        self._template_filter_timer.setSingleShot(True)
+        self._template_filter_timer.setInterval(self.FILTER_DELAY_MS)
+        self._template_filter_timer.timeout.connect(self.refresh_template_list)
+        
+        # On-disk copy of the last lists received, shown at startup before the
+        # controller pushes fresh data
+        self._list_digests: Dict[str, str] = {}
+        self._cache_timer = QTimer(self)
+        self._cache_timer.setSingleShot(True)
+        self._cache_timer.setInterval(self.CACHE_SAVE_DELAY_MS)
+        self._cache_timer.timeout.connect(self._save_cache)
         
         self.init_ui()
+        self._load_cache()
     
     def init_ui(self):
         """Initialize the user interface."""
@@ -48,20 +284,45 @@ class ConfigurationManagerWidget(QWidget):
         self.configurations_tab = self.create_configurations_tab()
         self.tab_widget.addTab(self.configurations_tab, "Configurations")
         
-        # Workspaces tab
-        self.workspaces_tab = self.create_workspaces_tab()
-        self.tab_widget.addTab(self.workspaces_tab, "Workspaces")
-        
-        # Templates tab
-        self.templates_tab = self.create_templates_tab()
-        self.tab_widget.addTab(self.templates_tab, "Templates")
-        
-        # Import/Export tab
-        self.import_export_tab = self.create_import_export_tab()
-        self.tab_widget.addTab(self.import_export_tab, "Import/Export")
+        # The other tabs start as placeholders and are built when first shown
+        self._tab_builders = {
+            self.WORKSPACES_TAB: ("Workspaces", "workspaces_tab", self.create_workspaces_tab),
+            self.TEMPLATES_TAB: ("Templates", "templates_tab", self.create_templates_tab),
+            self.IMPORT_EXPORT_TAB: ("Import/Export", "import_export_tab", self.create_import_export_tab),
+        }
+        for index in sorted(self._tab_builders):
+            self.tab_widget.addTab(QWidget(), self._tab_builders[index][0])
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
         
         layout.addWidget(self.tab_widget)
     
+    def _is_tab_built(self, index: int) -> bool:
+        """Check whether a tab's contents have been created."""
+        return index not in self._tab_builders
+    
+    def _ensure_tab_built(self, index: int):
+        """Build a placeholder tab the first time it is shown."""
+        if index not in self._tab_builders:
+            return
+        
+        label, attribute, builder = self._tab_builders.pop(index)
+        tab = builder()
+        setattr(self, attribute, tab)
+        
+        with _frozen(self.tab_widget):
+            placeholder = self.tab_widget.widget(index)
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, tab, label)
+            self.tab_widget.setCurrentIndex(index)
+        placeholder.deleteLater()
+        
+        # Show the data received while the tab was not built
+        if index == self.WORKSPACES_TAB:
+            self.refresh_workspace_list()
+        elif index == self.TEMPLATES_TAB:
+            self.refresh_template_categories()
+            self.refresh_template_list()
+    
     def create_configurations_tab(self) -> QWidget:
         """Create the configurations management tab."""
         tab = QWidget()
@@ -83,7 +344,6 @@ class ConfigurationManagerWidget(QWidget):
         
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("Search configurations...")
-        self.search_edit.textChanged.connect(self.filter_configurations)
         search_layout.addWidget(self.search_edit)
         
         self.category_filter = QComboBox()
@@ -100,8 +360,15 @@ class ConfigurationManagerWidget(QWidget):
         list_widget = QWidget()
         list_layout = QVBoxLayout(list_widget)
         
-        self.config_list = QListWidget()
-        self.config_list.itemClicked.connect(self.on_configuration_selected)
+        self.config_model = ConfigurationListModel(self)
+        self.config_proxy = ConfigurationFilterProxyModel(self)
+        self.config_proxy.setSourceModel(self.config_model)
+        self.search_edit.textChanged.connect(self.filter_configurations)
+        
+        self.config_list = QListView()
+        self.config_list.setModel(self.config_proxy)
+        self.config_list.setUniformItemSizes(True)
+        self.config_list.clicked.connect(self.on_configuration_selected)
         self.config_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.config_list.customContextMenuRequested.connect(self.show_config_context_menu)
         list_layout.addWidget(self.config_list)
@@ -158,6 +425,10 @@ class ConfigurationManagerWidget(QWidget):
         layout.addWidget(QLabel("Instructions:"))
         self.config_instructions_edit = QTextEdit()
         self.config_instructions_edit.setMaximumHeight(150)
+        # Owned by this widget, not the editor, so setDocument never deletes it
+        self._uncached_instructions_document = QTextDocument(self)
+        self._uncached_instructions_document.setDefaultFont(self.config_instructions_edit.font())
+        self.config_instructions_edit.setDocument(self._uncached_instructions_document)
         layout.addWidget(self.config_instructions_edit)
         
         # Statistics
@@ -272,6 +543,8 @@ class ConfigurationManagerWidget(QWidget):
     
     def create_import_export_tab(self) -> QWidget:
         """Create the import/export tab."""
+        from PyQt6.QtWidgets import QProgressBar, QTableView
+        
         tab = QWidget()
         layout = QVBoxLayout(tab)
         
@@ -323,9 +596,8 @@ class ConfigurationManagerWidget(QWidget):
         history_group = QGroupBox("Export History")
         history_layout = QVBoxLayout(history_group)
         
-        self.export_history_table = QTableWidget()
-        self.export_history_table.setColumnCount(4)
-        self.export_history_table.setHorizontalHeaderLabels(["Filename", "Size", "Created", "Type"])
+        self.export_history_table = QTableView()
+        self.export_history_table.setModel(self.export_history_model)
         history_layout.addWidget(self.export_history_table)
         
         layout.addWidget(history_group)
@@ -335,128 +607,271 @@ class ConfigurationManagerWidget(QWidget):
     
     def update_configurations(self, configurations: List[Dict[str, Any]]):
         """Update the configurations list."""
+        if self._is_unchanged("configurations", configurations):
+            return
+        
         self.configurations = configurations
+        self._last_loaded_id = None  # Details may be stale now
+        self._data_version += 1
+        self.config_model.set_configurations(configurations)
         self.refresh_configuration_list()
+        self._cache_timer.start()
     
     def update_workspaces(self, workspaces: List[Dict[str, Any]]):
         """Update the workspaces list."""
+        if self._is_unchanged("workspaces", workspaces):
+            return
+        
         self.workspaces = workspaces
+        
+        # First workspace wins on duplicate names, as with a front-to-back search
+        self._workspace_ids_by_name = {}
+        for workspace in reversed(workspaces):
+            if "name" in workspace:
+                self._workspace_ids_by_name[workspace["name"]] = workspace.get("id", "default")
+        
         self.refresh_workspace_list()
         self.refresh_workspace_combo()
+        self._cache_timer.start()
     
     def update_templates(self, templates: List[Dict[str, Any]]):
         """Update the templates list."""
+        if self._is_unchanged("templates", templates):
+            return
+        
         self.templates = templates
-        self.refresh_template_list()
+        self._category_counts = Counter(
+            template.get("category", "general") for template in templates
+        )
         self.refresh_template_categories()
+        self.refresh_template_list()
+        self._cache_timer.start()
     
-    def refresh_configuration_list(self):
-        """Refresh the configuration list display."""
-        self.config_list.clear()
-        
-        # Filter configurations by current workspace
-        workspace_configs = [
-            config for config in self.configurations
-            if self.current_workspace_id == "all" or 
-               config.get("workspace_id") == self.current_workspace_id
-        ]
-        
-        # Apply search and category filters
-        search_text = self.search_edit.text().lower()
-        category_filter = self.category_filter.currentText()
-        
-        for config in workspace_configs:
-            # Apply filters
-            if search_text and search_text not in config.get("name", "").lower():
-                continue
+    def _is_unchanged(self, name: str, entries: List[Dict[str, Any]]) -> bool:
+        """Check whether a list matches the one last shown, recording its digest."""
+        digest = hashlib.blake2b(
+            json.dumps(entries, sort_keys=True, default=str).encode("utf-8"),
+            digest_size=16
+        ).hexdigest()
+        
+        if self._list_digests.get(name) == digest:
+            return True
+        self._list_digests[name] = digest
+        return False
+    
+    def _load_cache(self):
+        """Show the lists saved by the previous session, if any."""
+        if self.cache_path is None:
+            return
+        
+        try:
+            if not self.cache_path.exists():
+                return
+            
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            self.update_workspaces(data.get("workspaces", []))
+            self.update_templates(data.get("templates", []))
+            self.update_configurations(data.get("configurations", []))
             
-            if category_filter != "All Categories" and config.get("category") != category_filter:
-                continue
+            # Freshly loaded from disk, nothing to write back
+            self._cache_timer.stop()
+            logger.debug("Loaded configuration manager cache")
+            
+        except Exception as e:
+            logger.error(f"Failed to load configuration manager cache: {e}")
+    
+    def _save_cache(self):
+        """Write the current lists to the on-disk cache."""
+        if self.cache_path is None:
+            return
+        
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # Create list item
-            item = QListWidgetItem(config.get("name", "Unnamed"))
-            item.setData(Qt.ItemDataRole.UserRole, config)
+            data = {
+                "configurations": self.configurations,
+                "workspaces": self.workspaces,
+                "templates": self.templates
+            }
             
-            # Add visual indicators
-            if config.get("is_shared", False):
-                item.setIcon(QIcon("shared"))  # Would need actual icon
+            tmp_path = self.cache_path.with_suffix(".tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, default=str)
+            os.replace(tmp_path, self.cache_path)
             
-            self.config_list.addItem(item)
+        except Exception as e:
+            logger.error(f"Failed to save configuration manager cache: {e}")
+    
+    def update_export_history(self, exports: List[Dict[str, Any]]):
+        """Update the export history table."""
+        self.export_history_model.set_rows([
+            (
+                export.get("filename", ""),
+                str(export.get("size", "")),
+                str(export.get("created", "")),
+                export.get("type", "export")
+            )
+            for export in exports
+        ])
+    
+    def refresh_configuration_list(self):
+        """Refresh the configuration list display."""
+        search_text = self.search_edit.text()
+        category = self.category_filter.currentText()
+        
+        # Nothing to do if neither the filters nor the data changed since the last run
+        key = (search_text, category, self.current_workspace_id, self._data_version)
+        if key == self._last_filter_key:
+            return
+        self._last_filter_key = key
+        
+        # Rows are filtered in the proxy model, so only the filter state is pushed
+        with _frozen(self.config_list):
+            self.config_proxy.set_filters(self.current_workspace_id, search_text, category)
     
     def refresh_workspace_list(self):
         """Refresh the workspace list display."""
-        self.workspace_list.clear()
+        if not self._is_tab_built(self.WORKSPACES_TAB):
+            return
         
-        for workspace in self.workspaces:
-            item = QListWidgetItem(workspace.get("name", "Unnamed"))
-            item.setData(Qt.ItemDataRole.UserRole, workspace)
-            self.workspace_list.addItem(item)
+        with _frozen(self.workspace_list):
+            self._sync_list_items(
+                self.workspace_list, self._workspace_items, self._workspace_entries, self.workspaces
+            )
     
     def refresh_workspace_combo(self):
-        """Refresh the workspace combo box."""
-        self.workspace_combo.clear()
-        self.workspace_combo.addItem("All Workspaces", "all")
+        """Refresh the workspace combo box, keeping the selected workspace."""
+        combo = self.workspace_combo
+        entries = [("All Workspaces", "all")] + [
+            (workspace.get("name", "Unnamed"), workspace.get("id")) for workspace in self.workspaces
+        ]
+        current = [(combo.itemText(i), combo.itemData(i)) for i in range(combo.count())]
+        if entries == current:
+            return
+        
+        previous_id = combo.currentData()
         
-        for workspace in self.workspaces:
-            self.workspace_combo.addItem(workspace.get("name", "Unnamed"), workspace.get("id"))
+        with _frozen(combo):
+            combo.clear()
+            for name, workspace_id in entries:
+                combo.addItem(name, workspace_id)
+            
+            # Restore selection by ID, falling back to "All Workspaces"
+            combo.setCurrentIndex(max(combo.findData(previous_id), 0))
+        
+        # Apply the selection once, and only if it actually changed
+        if combo.currentData() != previous_id:
+            self.on_workspace_changed(combo.currentText())
     
     def refresh_template_list(self):
         """Refresh the template list display."""
-        self.template_list.clear()
+        if not self._is_tab_built(self.TEMPLATES_TAB):
+            return
         
         category_filter = self.template_category_filter.currentText()
         
-        for template in self.templates:
-            # Apply category filter
-            if category_filter != "All Categories" and template.get("category") != category_filter:
-                continue
-            
-            item = QListWidgetItem(template.get("name", "Unnamed"))
-            item.setData(Qt.ItemDataRole.UserRole, template)
+        # Apply category filter
+        templates = [
+            template for template in self.templates
+            if category_filter == "All Categories" or template.get("category") == category_filter
+        ]
+        
+        with _frozen(self.template_list):
+            items = self._sync_list_items(
+                self.template_list, self._template_items, self._template_entries, templates
+            )
             
             # Mark built-in templates
-            if template.get("is_builtin", False):
-                font = item.font()
-                font.setBold(True)
-                item.setFont(font)
+            if ConfigurationManagerWidget._BOLD_FONT is None:
+                ConfigurationManagerWidget._BOLD_FONT = QFont()
+                ConfigurationManagerWidget._BOLD_FONT.setBold(True)
             
-            self.template_list.addItem(item)
+            for template, item in zip(templates, items):
+                is_builtin = template.get("is_builtin", False)
+                if item.font().bold() != is_builtin:
+                    item.setFont(self._BOLD_FONT if is_builtin else QFont())
+    
+    def _sync_list_items(
+        self,
+        list_widget: QListWidget,
+        displayed: Dict[str, QListWidgetItem],
+        lookup: Dict[str, Dict[str, Any]],
+        entries: List[Dict[str, Any]]
+    ) -> List[QListWidgetItem]:
+        """Update a list widget in place so it shows entries, in order.
+        
+        Items are matched by ID: stale ones are removed, new ones inserted, and kept
+        ones updated only where their text or position changed. Items carry only the
+        ID; lookup is refilled to map it back to the entry.
+        Returns the items in the order of entries.
+        """
+        keys = [entry.get("id") or entry.get("name", "") for entry in entries]
+        wanted = set(keys)
+        
+        lookup.clear()
+        lookup.update(zip(keys, entries))
+        
+        for key in [key for key in displayed if key not in wanted]:
+            list_widget.takeItem(list_widget.row(displayed.pop(key)))
+        
+        items = []
+        for row, (key, entry) in enumerate(zip(keys, entries)):
+            item = displayed.get(key)
+            if item is None:
+                item = QListWidgetItem()
+                item.setData(Qt.ItemDataRole.UserRole, key)
+                displayed[key] = item
+                list_widget.insertItem(row, item)
+            elif list_widget.row(item) != row:
+                list_widget.takeItem(list_widget.row(item))
+                list_widget.insertItem(row, item)
+            
+            name = entry.get("name", "Unnamed")
+            if item.text() != name:
+                item.setText(name)
+            items.append(item)
+        
+        return items
     
     def refresh_template_categories(self):
         """Refresh template category filter."""
-        current_category = self.template_category_filter.currentText()
-        self.template_category_filter.clear()
-        self.template_category_filter.addItem("All Categories")
+        if not self._is_tab_built(self.TEMPLATES_TAB):
+            return
+        
+        combo = self.template_category_filter
+        entries = ["All Categories"] + sorted(self._category_counts)
+        if entries == [combo.itemText(i) for i in range(combo.count())]:
+            return
         
-        categories = set(template.get("category", "general") for template in self.templates)
-        for category in sorted(categories):
-            self.template_category_filter.addItem(category)
+        current_category = combo.currentText()
         
-        # Restore selection if possible
-        index = self.template_category_filter.findText(current_category)
-        if index >= 0:
-            self.template_category_filter.setCurrentIndex(index)
+        with _frozen(combo):
+            combo.clear()
+            combo.addItems(entries)
+            
+            # Restore selection if possible
+            index = combo.findText(current_category)
+            if index >= 0:
+                combo.setCurrentIndex(index)
     
     # Signal handlers (placeholder implementations)
     def on_workspace_changed(self, workspace_name: str):
         """Handle workspace change."""
         # Find workspace ID by name
-        for workspace in self.workspaces:
-            if workspace.get("name") == workspace_name:
-                self.current_workspace_id = workspace.get("id", "default")
-                break
-        else:
-            self.current_workspace_id = "all"
+        self.current_workspace_id = self._workspace_ids_by_name.get(workspace_name, "all")
         
         self.refresh_configuration_list()
         self.workspace_changed.emit(self.current_workspace_id)
     
-    def on_configuration_selected(self, item: QListWidgetItem):
+    def on_configuration_selected(self, index: QModelIndex):
         """Handle configuration selection."""
-        config = item.data(Qt.ItemDataRole.UserRole)
+        config_id = index.data(Qt.ItemDataRole.UserRole)
+        config = self.config_model.configuration(config_id)
         if config:
             self.load_configuration_details(config)
-            self.configuration_selected.emit(config.get("id", ""))
+            self.configuration_selected.emit(config_id)
     
     def on_workspace_selected(self, item: QListWidgetItem):
         """Handle workspace selection."""
@@ -465,7 +880,7 @@ class ConfigurationManagerWidget(QWidget):
     
     def on_template_selected(self, item: QListWidgetItem):
         """Handle template selection."""
-        template = item.data(Qt.ItemDataRole.UserRole)
+        template = self._template_entries.get(item.data(Qt.ItemDataRole.UserRole))
         self.apply_template_button.setEnabled(True)
         
         # Don't allow deleting built-in templates
@@ -474,25 +889,89 @@ class ConfigurationManagerWidget(QWidget):
     
     def load_configuration_details(self, config: Dict[str, Any]):
         """Load configuration details into the form."""
-        self.config_name_edit.setText(config.get("name", ""))
-        self.config_description_edit.setText(config.get("description", ""))
-        self.config_category_edit.setText(config.get("category", ""))
-        self.config_instructions_edit.setText(config.get("instructions", ""))
+        config_id = config.get("id")
+        if config_id is not None and config_id == self._last_loaded_id:
+            return
+        self._last_loaded_id = config_id
+        
+        self._set_text_if_changed(self.config_name_edit, config.get("name", ""))
+        self._set_text_if_changed(self.config_description_edit, config.get("description", ""))
+        self._set_text_if_changed(self.config_category_edit, config.get("category", ""))
+        
+        self._show_instructions(config)
         
         # Update statistics
-        self.usage_count_label.setText(str(config.get("usage_count", 0)))
-        self.message_count_label.setText(str(config.get("total_messages", 0)))
-        self.created_label.setText(config.get("created_at", "-"))
-        self.modified_label.setText(config.get("modified_at", "-"))
+        self._set_text_if_changed(self.usage_count_label, str(config.get("usage_count", 0)))
+        self._set_text_if_changed(self.message_count_label, str(config.get("total_messages", 0)))
+        self._set_text_if_changed(self.created_label, config.get("created_at", "-"))
+        self._set_text_if_changed(self.modified_label, config.get("modified_at", "-"))
+    
+    def _show_instructions(self, config: Dict[str, Any]):
+        """Show a configuration's instructions, reusing its laid-out document if cached."""
+        config_id = config.get("id")
+        instructions = config.get("instructions", "")
+        
+        # Unsaved edits must not be shown again as if they were the saved text
+        shown = self.config_instructions_edit.document()
+        if shown is not self._uncached_instructions_document and shown.isModified():
+            self._drop_instructions_document(shown)
+        
+        if config_id is None:
+            # Not cacheable; use the editor's own document
+            if self.config_instructions_edit.document() is not self._uncached_instructions_document:
+                self.config_instructions_edit.setDocument(self._uncached_instructions_document)
+            if self.config_instructions_edit.toPlainText() != instructions:
+                self.config_instructions_edit.setPlainText(instructions)
+            return
+        
+        modified_at = config.get("modified_at")
+        cached = self._instructions_documents.get(config_id)
+        if cached is not None and cached[0] == modified_at:
+            document = cached[1]
+            self._instructions_documents.move_to_end(config_id)
+        else:
+            if cached is not None:
+                cached[1].deleteLater()
+            document = QTextDocument(instructions, self)
+            document.setDefaultFont(self.config_instructions_edit.font())
+            self._instructions_documents[config_id] = (modified_at, document)
+            
+            if len(self._instructions_documents) > self.INSTRUCTIONS_CACHE_SIZE:
+                _, (_, evicted) = self._instructions_documents.popitem(last=False)
+                evicted.deleteLater()
+        
+        if self.config_instructions_edit.document() is not document:
+            self.config_instructions_edit.setDocument(document)
+    
+    def _drop_instructions_document(self, document: QTextDocument):
+        """Remove a document from the instructions cache and delete it once it is replaced."""
+        for config_id, (_, cached_document) in self._instructions_documents.items():
+            if cached_document is document:
+                del self._instructions_documents[config_id]
+                break
+        
+        # Still shown in the editor, so delete only after the next document is set
+        document.deleteLater()
+    
+    @staticmethod
+    def _set_text_if_changed(widget, text: str):
+        """Set a line edit's or label's text only if it differs, avoiding textChanged."""
+        if widget.text() != text:
+            widget.setText(text)
     
     # Placeholder methods for actions
     def filter_configurations(self):
-        """Filter configurations based on search and category."""
-        self.refresh_configuration_list()
+        """Filter configurations based on search and category, after a short delay."""
+        current_filter = (self.search_edit.text(), self.category_filter.currentText())
+        if current_filter == self._last_filter:
+            return
+        
+        self._last_filter = current_filter
+        self._filter_timer.start()
     
     def filter_templates(self):
-        """Filter templates based on category."""
-        self.refresh_template_list()
+        """Filter templates based on category, after a short delay."""
+        self._template_filter_timer.start()
     
     def create_new_configuration(self):
         """Create a new configuration."""
@@ -8,7 +8,7 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, 
     QLabel, QLineEdit, QPushButton, QGroupBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from loguru import logger
 
 
@@ -18,8 +18,24 @@ class InstructionsWidget(QWidget):
     instructions_changed = pyqtSignal(str)
     agent_name_changed = pyqtSignal(str)
     
+    # Delay before an edit is emitted, so a burst of keystrokes emits once
+    CHANGE_DELAY_MS = 150
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._last_instructions = ""
+        self._last_name = ""
+        
+        self._instructions_timer = QTimer(self)
+        self._instructions_timer.setSingleShot(True)
+        self._instructions_timer.setInterval(self.CHANGE_DELAY_MS)
+        self._instructions_timer.timeout.connect(self._emit_instructions)
+        
+        self._name_timer = QTimer(self)
+        self._name_timer.setSingleShot(True)
+        self._name_timer.setInterval(self.CHANGE_DELAY_MS)
+        self._name_timer.timeout.connect(self._emit_agent_name)
+        
         self.init_ui()
         
     def init_ui(self):
@@ -78,16 +94,41 @@ class InstructionsWidget(QWidget):
     
     def on_name_changed(self):
         """Handle agent name change."""
+        self._name_timer.start()
+    
+    def on_instructions_changed(self):
+        """Handle instructions text change."""
+        self._instructions_timer.start()
+    
+    def _emit_agent_name(self):
+        """Emit the agent name if it differs from the last one emitted."""
         name = self.name_edit.text().strip()
+        if name == self._last_name:
+            return
+        
+        self._last_name = name
         self.agent_name_changed.emit(name)
         logger.debug(f"Agent name changed to: {name}")
     
-    def on_instructions_changed(self):
-        """Handle instructions text change."""
+    def _emit_instructions(self):
+        """Emit the instructions if they differ from the last ones emitted."""
         instructions = self.instructions_edit.toPlainText()
+        if instructions == self._last_instructions:
+            return
+        
+        self._last_instructions = instructions
         self.instructions_changed.emit(instructions)
         logger.debug("Instructions changed")
     
+    def flush(self):
+        """Emit pending name and instructions edits now instead of after the delay."""
+        if self._name_timer.isActive():
+            self._name_timer.stop()
+            self._emit_agent_name()
+        if self._instructions_timer.isActive():
+            self._instructions_timer.stop()
+            self._emit_instructions()
+    
     def clear_instructions(self):
         """Clear the instructions text."""
         self.instructions_edit.clear()
@@ -5,15 +5,237 @@ Widget for managing knowledge sources and file ingestion.
 """
 
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QListWidget,
-    QLabel, QPushButton, QGroupBox, QListWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QListView,
+    QLabel, QPushButton, QGroupBox,
     QFileDialog, QMessageBox, QInputDialog, QMenu,
-    QCheckBox, QProgressBar
+    QCheckBox, QDialog, QFormLayout, QComboBox,
+    QSpinBox, QLineEdit, QStyledItemDelegate, QStyleOptionViewItem
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QAction, QIcon, QColor
+from PyQt6.QtCore import Qt, pyqtSignal, QAbstractListModel, QModelIndex, QSize
+from PyQt6.QtGui import QAction, QColor, QBrush, QPixmap, QPainter
 from loguru import logger
-from pathlib import Path
+from contextlib import contextmanager
+import hashlib
+from typing import Dict, List, Optional, Sequence
+
+
+# Compact status codes stored per row; unknown statuses show no indicator
+STATUS_NONE, STATUS_PROCESSING, STATUS_INDEXED, STATUS_ERROR = range(4)
+_STATUS_CODES = {
+    "processing": STATUS_PROCESSING,
+    "indexed": STATUS_INDEXED,
+    "error": STATUS_ERROR,
+}
+
+# Indicator glyph and row background per status; glyphs are rendered to pixmaps
+# once by the delegate
+_STATUS_TABLE = {
+    STATUS_PROCESSING: ("⏳", QBrush(QColor(255, 255, 200))),  # Hourglass, light yellow
+    STATUS_INDEXED: ("✅", QBrush(QColor(200, 255, 200))),  # Check mark, light green
+    STATUS_ERROR: ("❌", QBrush(QColor(255, 200, 200))),  # X mark, light red
+}
+_MONITORING_GLYPH = "👁️"  # Eye emoji for monitoring
+
+# Model roles read by KnowledgeSourceDelegate
+STATUS_ROLE = Qt.ItemDataRole.UserRole + 1
+MONITORING_ROLE = Qt.ItemDataRole.UserRole + 2
+
+
+# Display prefixes for the known source types
+_TYPE_PREFIX = {
+    source_type: f"[{source_type.upper()}] "
+    for source_type in ("file", "folder", "github", "google_drive", "url", "website", "sitemap", "unknown")
+}
+
+
+def _basename(path: str) -> str:
+    """Final component of a '/' or '\\' separated path, without building a Path."""
+    path = path.rstrip("/\\")
+    return path[max(path.rfind("/"), path.rfind("\\")) + 1:]
+
+
+def _display_base(source_info: dict) -> str:
+    """Display text of a source without status indicators."""
+    source_type = source_info.get("type", "unknown")
+    source_path = source_info.get("path", "")
+    prefix = _TYPE_PREFIX.get(source_type) or f"[{source_type.upper()}] "
+    return prefix + (_basename(source_path) if source_type in ("file", "folder") else source_path)
+
+
+class KnowledgeSourceModel(QAbstractListModel):
+    """List model over knowledge source dicts, indexed by source ID.
+    
+    Display text is formatted when a source is added; status and monitoring are
+    kept as small per-row values for KnowledgeSourceDelegate to paint.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.sources: list = []
+        self._id_index: Dict[str, int] = {}
+        self._bases: List[str] = []
+        self._status: List[int] = []
+        self._monitoring: List[bool] = []
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Number of sources."""
+        return 0 if parent.isValid() else len(self.sources)
+    
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Display text, status code, monitoring flag, or the source dict for UserRole."""
+        if not index.isValid():
+            return None
+        
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._bases[row]
+        if role == STATUS_ROLE:
+            return self._status[row]
+        if role == MONITORING_ROLE:
+            return self._monitoring[row]
+        if role == Qt.ItemDataRole.UserRole:
+            return self.sources[row]
+        return None
+    
+    def set_sources(self, sources: list):
+        """Show a new list of sources; the list is used, not copied."""
+        self.beginResetModel()
+        self.sources = sources
+        self._bases = [_display_base(source_info) for source_info in sources]
+        self._status = [STATUS_NONE] * len(sources)
+        self._monitoring = [False] * len(sources)
+        self._reindex()
+        self.endResetModel()
+    
+    def append_source(self, source_info: dict):
+        """Append a source."""
+        row = len(self.sources)
+        
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.sources.append(source_info)
+        self._bases.append(_display_base(source_info))
+        self._status.append(STATUS_NONE)
+        self._monitoring.append(False)
+        self._id_index[source_info.get("id")] = row
+        self.endInsertRows()
+    
+    def remove_rows(self, rows: List[int]):
+        """Remove the given rows.
+        
+        A single row is removed in place; larger selections are filtered out in
+        one pass under a single model reset.
+        """
+        removed = set(rows)
+        if not removed:
+            return
+        
+        if len(removed) == 1:
+            row = removed.pop()
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self.sources[row]
+            del self._bases[row]
+            del self._status[row]
+            del self._monitoring[row]
+            self.endRemoveRows()
+        else:
+            keep = [row for row in range(len(self.sources)) if row not in removed]
+            self.beginResetModel()
+            # Slice assignment keeps the list shared with the widget
+            self.sources[:] = [self.sources[row] for row in keep]
+            self._bases = [self._bases[row] for row in keep]
+            self._status = [self._status[row] for row in keep]
+            self._monitoring = [self._monitoring[row] for row in keep]
+            self.endResetModel()
+        self._reindex()
+    
+    def clear(self):
+        """Remove all sources, emptying the list in place."""
+        self.beginResetModel()
+        self.sources.clear()
+        self._id_index = {}
+        self._bases = []
+        self._status = []
+        self._monitoring = []
+        self.endResetModel()
+    
+    def set_status(self, source_id: str, status: str, is_monitoring: bool):
+        """Update the status shown for a source."""
+        row = self._id_index.get(source_id)
+        if row is None:
+            return
+        
+        code = _STATUS_CODES.get(status, STATUS_NONE)
+        if self._status[row] == code and self._monitoring[row] == is_monitoring:
+            return
+        self._status[row] = code
+        self._monitoring[row] = is_monitoring
+        
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [STATUS_ROLE, MONITORING_ROLE])
+    
+    def _reindex(self):
+        """Rebuild the source ID to row index."""
+        self._id_index = {source_info.get("id"): row for row, source_info in enumerate(self.sources)}
+
+
+class KnowledgeSourceDelegate(QStyledItemDelegate):
+    """Paints a source row with its status background and indicator icons.
+    
+    Status glyphs are rendered to pixmaps once, so painting a row blits cached
+    pixmaps instead of shaping emoji text.
+    """
+    
+    ICON_SIZE = 16
+    ICON_SPACING = 4
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Status code -> (pixmap, brush), so painting needs a single lookup
+        self._status_paint = {
+            code: (self._glyph_pixmap(glyph), brush) for code, (glyph, brush) in _STATUS_TABLE.items()
+        }
+        self._monitoring_pixmap = self._glyph_pixmap(_MONITORING_GLYPH)
+    
+    def paint(self, painter, option, index):
+        """Draw the background, the source text, then the status icons at the right."""
+        pixmaps = []
+        if index.data(MONITORING_ROLE):
+            pixmaps.append(self._monitoring_pixmap)
+        
+        status_paint = self._status_paint.get(index.data(STATUS_ROLE))
+        if status_paint is not None:
+            status_pixmap, brush = status_paint
+            pixmaps.append(status_pixmap)
+            painter.fillRect(option.rect, brush)
+        
+        # Keep the text clear of the icons
+        text_option = QStyleOptionViewItem(option)
+        text_option.rect = option.rect.adjusted(
+            0, 0, -len(pixmaps) * (self.ICON_SIZE + self.ICON_SPACING), 0
+        )
+        super().paint(painter, text_option, index)
+        
+        x = option.rect.right() - self.ICON_SPACING
+        y = option.rect.top() + (option.rect.height() - self.ICON_SIZE) // 2
+        for pixmap in reversed(pixmaps):
+            x -= self.ICON_SIZE
+            painter.drawPixmap(x, y, pixmap)
+            x -= self.ICON_SPACING
+    
+    def sizeHint(self, option, index) -> QSize:
+        """Text size, tall enough for the status icons."""
+        size = super().sizeHint(option, index)
+        return QSize(size.width(), max(size.height(), self.ICON_SIZE))
+    
+    def _glyph_pixmap(self, glyph: str) -> QPixmap:
+        """Render an indicator glyph into a transparent pixmap."""
+        pixmap = QPixmap(self.ICON_SIZE, self.ICON_SIZE)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, glyph)
+        painter.end()
+        return pixmap
 
 
 class KnowledgeWidget(QWidget):
@@ -29,6 +251,14 @@ class KnowledgeWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.knowledge_sources = []
+        
+        # Nested batch() depth, and whether sources changed inside the batch
+        self._batch_depth = 0
+        self._batch_dirty = False
+        
+        # Add URL dialog, built on first use by _build_url_dialog()
+        self._url_dialog: Optional[QDialog] = None
+        
         self.init_ui()
         
     def init_ui(self):
@@ -43,7 +273,13 @@ class KnowledgeWidget(QWidget):
         list_label = QLabel("Knowledge Sources:")
         group_layout.addWidget(list_label)
         
-        self.file_list = QListWidget()
+        self.source_model = KnowledgeSourceModel(self)
+        self.source_model.set_sources(self.knowledge_sources)
+        
+        self.file_list = QListView()
+        self.file_list.setModel(self.source_model)
+        self.file_list.setItemDelegate(KnowledgeSourceDelegate(self.file_list))
+        self.file_list.setUniformItemSizes(True)
         self.file_list.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.file_list.customContextMenuRequested.connect(self.show_context_menu)
         group_layout.addWidget(self.file_list)
@@ -125,16 +361,46 @@ class KnowledgeWidget(QWidget):
         group_layout.addLayout(button_layout)
         
         # Connect selection change
-        self.file_list.itemSelectionChanged.connect(self.on_selection_changed)
+        self.file_list.selectionModel().selectionChanged.connect(self.on_selection_changed)
         
         layout.addWidget(group_box)
         
         logger.debug("KnowledgeWidget initialized")
     
+    @contextmanager
+    def batch(self):
+        """Group source changes so signals are emitted once at the end.
+        
+        Repaints and selection signals are suspended for the outermost batch;
+        the selection-dependent buttons are refreshed once when it ends.
+        """
+        self._batch_depth += 1
+        if self._batch_depth == 1:
+            self.file_list.setUpdatesEnabled(False)
+            self.file_list.selectionModel().blockSignals(True)
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.file_list.selectionModel().blockSignals(False)
+                self.file_list.setUpdatesEnabled(True)
+                self.on_selection_changed()
+                if self._batch_dirty:
+                    self._batch_dirty = False
+                    self.knowledge_sources_changed.emit(self.knowledge_sources)
+    
+    def _emit_sources_changed(self):
+        """Emit knowledge_sources_changed, or defer it to the end of the current batch."""
+        if self._batch_depth:
+            self._batch_dirty = True
+        else:
+            self.knowledge_sources_changed.emit(self.knowledge_sources)
+    
     def show_context_menu(self, position):
         """Show context menu for file list."""
-        item = self.file_list.itemAt(position)
-        if item is None:
+        index = self.file_list.indexAt(position)
+        if not index.isValid():
             return
         
         menu = QMenu(self)
@@ -144,19 +410,19 @@ class KnowledgeWidget(QWidget):
         menu.addAction(remove_action)
 
         # Add monitoring toggle if applicable
-        source_info = item.data(Qt.ItemDataRole.UserRole)
+        source_info = index.data(Qt.ItemDataRole.UserRole)
         if source_info and source_info.get("type") in ["file", "folder"]:
             menu.addSeparator()
 
             monitor_action = QAction("Toggle Monitoring", self)
-            monitor_action.triggered.connect(lambda: self.toggle_monitoring(item))
+            monitor_action.triggered.connect(lambda: self.toggle_monitoring(index))
             menu.addAction(monitor_action)
         
         menu.exec(self.file_list.mapToGlobal(position))
     
     def on_selection_changed(self):
         """Handle selection change in file list."""
-        has_selection = len(self.file_list.selectedItems()) > 0
+        has_selection = self.file_list.selectionModel().hasSelection()
         self.remove_button.setEnabled(has_selection)
     
     def add_files(self):
@@ -169,8 +435,9 @@ class KnowledgeWidget(QWidget):
         
         if file_dialog.exec():
             files = file_dialog.selectedFiles()
-            for file_path in files:
-                self.add_knowledge_source(file_path, "file")
+            with self.batch():
+                for file_path in files:
+                    self.add_knowledge_source(file_path, "file")
             logger.info(f"Added {len(files)} files to knowledge base")
     
     def add_folder(self):
@@ -213,10 +480,8 @@ class KnowledgeWidget(QWidget):
             self.add_knowledge_source(folder_url.strip(), "google_drive")
             logger.info(f"Added Google Drive folder: {folder_url}")
 
-    def add_url(self):
-        """Add URL or website to knowledge base."""
-        from PyQt6.QtWidgets import QDialog, QVBoxLayout, QFormLayout, QComboBox, QSpinBox
-
+    def _build_url_dialog(self):
+        """Create the Add URL dialog once; add_url resets and reuses it."""
         dialog = QDialog(self)
         dialog.setWindowTitle("Add URL/Website")
         dialog.setModal(True)
@@ -226,25 +491,23 @@ class KnowledgeWidget(QWidget):
         form_layout = QFormLayout()
 
         # URL input
-        url_edit = QLineEdit()
-        url_edit.setPlaceholderText("https://example.com")
-        form_layout.addRow("URL:", url_edit)
+        self._url_edit = QLineEdit()
+        self._url_edit.setPlaceholderText("https://example.com")
+        form_layout.addRow("URL:", self._url_edit)
 
         # Crawl mode
-        crawl_mode_combo = QComboBox()
-        crawl_mode_combo.addItems(["Single Page", "Crawl Website", "From Sitemap"])
-        form_layout.addRow("Mode:", crawl_mode_combo)
+        self._crawl_mode_combo = QComboBox()
+        self._crawl_mode_combo.addItems(["Single Page", "Crawl Website", "From Sitemap"])
+        form_layout.addRow("Mode:", self._crawl_mode_combo)
 
         # Max pages
-        max_pages_spin = QSpinBox()
-        max_pages_spin.setRange(1, 100)
-        max_pages_spin.setValue(10)
-        form_layout.addRow("Max Pages:", max_pages_spin)
+        self._max_pages_spin = QSpinBox()
+        self._max_pages_spin.setRange(1, 100)
+        form_layout.addRow("Max Pages:", self._max_pages_spin)
 
         # Same domain only
-        same_domain_checkbox = QCheckBox("Same domain only")
-        same_domain_checkbox.setChecked(True)
-        form_layout.addRow("", same_domain_checkbox)
+        self._same_domain_checkbox = QCheckBox("Same domain only")
+        form_layout.addRow("", self._same_domain_checkbox)
 
         layout.addLayout(form_layout)
 
@@ -260,15 +523,28 @@ class KnowledgeWidget(QWidget):
         button_layout.addWidget(ok_button)
         layout.addLayout(button_layout)
 
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            url = url_edit.text().strip()
+        self._url_dialog = dialog
+
+    def add_url(self):
+        """Add URL or website to knowledge base."""
+        if self._url_dialog is None:
+            self._build_url_dialog()
+
+        # Reset fields left over from the previous use
+        self._url_edit.clear()
+        self._crawl_mode_combo.setCurrentIndex(0)
+        self._max_pages_spin.setValue(10)
+        self._same_domain_checkbox.setChecked(True)
+
+        if self._url_dialog.exec() == QDialog.DialogCode.Accepted:
+            url = self._url_edit.text().strip()
             if url:
                 # Build configuration
                 crawl_modes = {"Single Page": "single", "Crawl Website": "crawl", "From Sitemap": "sitemap"}
                 config = {
-                    "crawl_mode": crawl_modes[crawl_mode_combo.currentText()],
-                    "max_pages": max_pages_spin.value(),
-                    "same_domain_only": same_domain_checkbox.isChecked()
+                    "crawl_mode": crawl_modes[self._crawl_mode_combo.currentText()],
+                    "max_pages": self._max_pages_spin.value(),
+                    "same_domain_only": self._same_domain_checkbox.isChecked()
                 }
 
                 self.url_source_requested.emit(url, config)
@@ -276,8 +552,8 @@ class KnowledgeWidget(QWidget):
 
     def batch_process_sources(self):
         """Request batch processing of selected sources."""
-        selected_items = self.file_list.selectedItems()
-        if not selected_items:
+        selected_indexes = self.file_list.selectionModel().selectedRows()
+        if not selected_indexes:
             QMessageBox.information(
                 self,
                 "Batch Processing",
@@ -286,8 +562,8 @@ class KnowledgeWidget(QWidget):
             return
 
         sources = []
-        for item in selected_items:
-            source_info = item.data(Qt.ItemDataRole.UserRole)
+        for index in selected_indexes:
+            source_info = index.data(Qt.ItemDataRole.UserRole)
             if source_info:
                 sources.append(source_info)
 
@@ -307,10 +583,9 @@ class KnowledgeWidget(QWidget):
     
     def add_knowledge_source(self, source: str, source_type: str, source_id: str = None):
         """Add a knowledge source to the list."""
-        import hashlib
 
         if not source_id:
-            source_id = f"source_{len(self.knowledge_sources)}_{hashlib.md5(source.encode()).hexdigest()[:8]}"
+            source_id = f"source_{len(self.knowledge_sources)}_{hashlib.blake2b(source.encode('utf-8'), digest_size=16).hexdigest()}"
 
         source_info = {
             "id": source_id,
@@ -319,33 +594,23 @@ class KnowledgeWidget(QWidget):
             "status": "pending"
         }
         
-        self.knowledge_sources.append(source_info)
-        
-        # Add to UI list
-        display_text = f"[{source_type.upper()}] {Path(source).name if source_type in ['file', 'folder'] else source}"
-        item = QListWidgetItem(display_text)
-        item.setData(Qt.ItemDataRole.UserRole, source_info)
-        self.file_list.addItem(item)
+        # Add to the list (the model appends to self.knowledge_sources)
+        self.source_model.append_source(source_info)
         
         # Emit signal
-        self.knowledge_sources_changed.emit(self.knowledge_sources)
+        self._emit_sources_changed()
     
     def remove_selected(self):
         """Remove selected items from knowledge base."""
-        selected_items = self.file_list.selectedItems()
-        if not selected_items:
+        selected_indexes = self.file_list.selectionModel().selectedRows()
+        if not selected_indexes:
             return
         
-        for item in selected_items:
-            source_info = item.data(Qt.ItemDataRole.UserRole)
-            if source_info in self.knowledge_sources:
-                self.knowledge_sources.remove(source_info)
-            
-            row = self.file_list.row(item)
-            self.file_list.takeItem(row)
+        with self.batch():
+            self.source_model.remove_rows([index.row() for index in selected_indexes])
         
-        logger.info(f"Removed {len(selected_items)} items from knowledge base")
-        self.knowledge_sources_changed.emit(self.knowledge_sources)
+        logger.info(f"Removed {len(selected_indexes)} items from knowledge base")
+        self._emit_sources_changed()
     
     def clear_all(self):
         """Clear all knowledge sources."""
@@ -358,16 +623,16 @@ class KnowledgeWidget(QWidget):
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            self.knowledge_sources.clear()
-            self.file_list.clear()
-            logger.info("Cleared all knowledge sources")
-            self.knowledge_sources_changed.emit(self.knowledge_sources)
+            with self.batch():
+                self.source_model.clear()
+                logger.info("Cleared all knowledge sources")
+                self._emit_sources_changed()
     
     def refresh_sources(self):
         """Refresh knowledge sources status."""
         logger.info("Refresh knowledge sources requested")
         # Emit signal to refresh - controller will handle the actual refresh
-        self.knowledge_sources_changed.emit(self.knowledge_sources)
+        self._emit_sources_changed()
 
     def reindex_all(self):
         """Request reindexing of all sources."""
@@ -383,9 +648,9 @@ class KnowledgeWidget(QWidget):
             logger.info("Reindex all sources requested")
             self.reindex_requested.emit()
 
-    def toggle_monitoring(self, item: QListWidgetItem):
+    def toggle_monitoring(self, index: QModelIndex):
         """Toggle monitoring for a specific source."""
-        source_info = item.data(Qt.ItemDataRole.UserRole)
+        source_info = index.data(Qt.ItemDataRole.UserRole)
         if source_info:
             source_id = source_info.get("id")
             if source_id:
@@ -393,62 +658,20 @@ class KnowledgeWidget(QWidget):
 
     def update_source_status(self, source_id: str, status: str, is_monitoring: bool = False):
         """Update the visual status of a source."""
-        for i in range(self.file_list.count()):
-            item = self.file_list.item(i)
-            source_info = item.data(Qt.ItemDataRole.UserRole)
-
-            if source_info and source_info.get("id") == source_id:
-                # Update the display text with status
-                source_type = source_info.get("type", "unknown")
-                source_path = source_info.get("path", "")
-
-                display_text = f"[{source_type.upper()}] {Path(source_path).name if source_type in ['file', 'folder'] else source_path}"
-
-                # Add status indicators
-                if is_monitoring:
-                    display_text += " 👁️"  # Eye emoji for monitoring
-
-                if status == "processing":
-                    display_text += " ⏳"  # Hourglass for processing
-                elif status == "indexed":
-                    display_text += " ✅"  # Check mark for indexed
-                elif status == "error":
-                    display_text += " ❌"  # X mark for error
-
-                item.setText(display_text)
-
-                # Update color based on status
-                if status == "error":
-                    item.setBackground(QColor(255, 200, 200))  # Light red
-                elif status == "indexed":
-                    item.setBackground(QColor(200, 255, 200))  # Light green
-                elif status == "processing":
-                    item.setBackground(QColor(255, 255, 200))  # Light yellow
-                else:
-                    item.setBackground(QColor(255, 255, 255))  # White
-
-                break
-    
-    def get_knowledge_sources(self) -> list:
-        """Get the current knowledge sources."""
-        return self.knowledge_sources.copy()
+        self.source_model.set_status(source_id, status, is_monitoring)
+    
+    def get_knowledge_sources(self) -> Sequence[dict]:
+        """Get a read-only snapshot of the current knowledge sources."""
+        return tuple(self.knowledge_sources)
     
     def set_knowledge_sources(self, sources: list):
         """Set the knowledge sources."""
         self.knowledge_sources = sources.copy()
-        self.file_list.clear()
-        
-        for source_info in self.knowledge_sources:
-            source_type = source_info.get("type", "unknown")
-            source_path = source_info.get("path", "")
-            
-            display_text = f"[{source_type.upper()}] {Path(source_path).name if source_type in ['file', 'folder'] else source_path}"
-            item = QListWidgetItem(display_text)
-            item.setData(Qt.ItemDataRole.UserRole, source_info)
-            self.file_list.addItem(item)
+        with self.batch():
+            self.source_model.set_sources(self.knowledge_sources)
 
     def clear_all_sources(self):
         """Clear all knowledge sources programmatically."""
-        self.knowledge_sources.clear()
-        self.file_list.clear()
-        self.knowledge_sources_changed.emit(self.knowledge_sources)
+        with self.batch():
+            self.source_model.clear()
+            self._emit_sources_changed()
@@ -8,10 +8,9 @@ from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLineEdit, QPushButton, QLabel, QGroupBox,
     QTabWidget, QWidget, QSpinBox, QCheckBox,
-    QMessageBox, QTextEdit
+    QMessageBox
 )
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
 from loguru import logger
 
 from services.config_service import ConfigService
@@ -23,6 +22,7 @@ class SettingsWidget(QDialog):
     def __init__(self, config_service: ConfigService, parent=None):
         super().__init__(parent)
         self.config_service = config_service
+        self._loaded_api_key = None
         self.init_ui()
         self.load_settings()
         
@@ -101,17 +101,19 @@ class SettingsWidget(QDialog):
         instructions_group = QGroupBox("Instructions")
         instructions_layout = QVBoxLayout(instructions_group)
         
-        instructions_text = QTextEdit()
-        instructions_text.setReadOnly(True)
-        instructions_text.setMaximumHeight(120)
-        instructions_text.setPlainText(
-            "To get your Google Gemini API key:\n"
-            "1. Go to https://makersuite.google.com/app/apikey\n"
-            "2. Sign in with your Google account\n"
-            "3. Click 'Create API Key'\n"
-            "4. Copy the generated key and paste it above\n\n"
+        instructions_text = QLabel(
+            "To get your Google Gemini API key:<br>"
+            "1. Go to <a href=\"https://makersuite.google.com/app/apikey\">"
+            "https://makersuite.google.com/app/apikey</a><br>"
+            "2. Sign in with your Google account<br>"
+            "3. Click 'Create API Key'<br>"
+            "4. Copy the generated key and paste it above<br><br>"
             "Your API key will be stored securely in your system's credential manager."
         )
+        instructions_text.setTextFormat(Qt.TextFormat.RichText)
+        instructions_text.setWordWrap(True)
+        instructions_text.setTextInteractionFlags(Qt.TextInteractionFlag.TextBrowserInteraction)
+        instructions_text.setOpenExternalLinks(True)
         instructions_layout.addWidget(instructions_text)
         
         layout.addWidget(instructions_group)
@@ -206,6 +208,7 @@ class SettingsWidget(QDialog):
         try:
             # Load API key
             api_key = self.config_service.get_api_key()
+            self._loaded_api_key = api_key
             if api_key:
                 self.api_key_edit.setText(api_key)
             
@@ -225,21 +228,27 @@ class SettingsWidget(QDialog):
     def save_settings(self):
         """Save settings to config service."""
         try:
-            # Save API key
+            # Save API key, skipping the keyring write when it is unchanged
             api_key = self.api_key_edit.text().strip()
-            if api_key:
-                self.config_service.set_api_key(api_key)
+            if api_key and api_key != self._loaded_api_key:
+                if self.config_service.set_api_key(api_key):
+                    self._loaded_api_key = api_key
             
             # Save other settings
             settings = self.config_service.settings
-            settings.auto_save_interval = self.auto_save_interval_spin.value()
-            settings.max_chat_history = self.max_history_spin.value()
-            settings.embedding_model = self.embedding_model_edit.text().strip()
-            settings.chunk_size = self.chunk_size_spin.value()
-            settings.chunk_overlap = self.chunk_overlap_spin.value()
+            values = {
+                "auto_save_interval": self.auto_save_interval_spin.value(),
+                "max_chat_history": self.max_history_spin.value(),
+                "embedding_model": self.embedding_model_edit.text().strip(),
+                "chunk_size": self.chunk_size_spin.value(),
+                "chunk_overlap": self.chunk_overlap_spin.value(),
+            }
+            changed = {name: value for name, value in values.items() if getattr(settings, name) != value}
+            for name, value in changed.items():
+                setattr(settings, name, value)
             
-            # Save to file
-            if self.config_service.save_settings():
+            # Save to file only when something changed
+            if not changed or self.config_service.save_settings():
                 QMessageBox.information(self, "Settings", "Settings saved successfully!")
                 self.accept()
             else:
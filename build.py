@@ -5,26 +5,180 @@ Build Script for Custom Gemini Agent GUI
 This script builds the application into a standalone executable using PyInstaller.
 """
 
+import os
 import sys
+import argparse
+import hashlib
 import subprocess
 import shutil
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
 
-def run_command(command, description):
-    """Run a command and handle errors."""
-    print(f"\n{description}...")
+# Build outputs and the signature of the inputs they were built from
+EXE_PATH = Path("dist/CustomGeminiAgentGUI.exe")
+ICON_PATH = Path("assets/icon.ico")
+INSTALLER_PATH = Path("CustomGeminiAgentGUI-Setup.exe")
+SPEC_PATH = Path("gemini_gui.spec")
+SPEC_TEMPLATE_PATH = Path("gemini_gui.spec.tmpl")
+
+# PyInstaller's analysis follows every import written in the source, including
+# the lazy ones in rag_service. These packages also load submodules by name at
+# runtime (chromadb components, langchain's lazy loaders, keyring backends), so
+# the spec collects all of their submodules
+HIDDEN_IMPORT_PACKAGES = [
+    'chromadb',
+    'sentence_transformers',
+    'langchain.document_loaders',
+    'langchain.text_splitter',
+    'keyring.backends',
+]
+
+# Test tooling and toolkits the app never uses
+SPEC_EXCLUDES = [
+    'tests',
+    'pytest',
+    'pytestqt',
+    '_pytest',
+    'tkinter',
+    'IPython',
+    'notebook',
+]
+BUILD_CACHE_DIR = Path(".build-cache")
+SIGNATURE_FILE = BUILD_CACHE_DIR / "signature.txt"
+INSTALLER_SIGNATURE_FILE = BUILD_CACHE_DIR / "installer.sig"
+
+# PyInstaller work directory, kept between runs so its analysis is reused; set
+# BUILD_WORKPATH to move it, e.g. to a RAM disk such as /dev/shm/pyi-work
+WORK_PATH = Path(os.environ.get("BUILD_WORKPATH") or BUILD_CACHE_DIR / "work")
+
+# Files and directories whose changes require a rebuild
+BUILD_INPUTS = ("app", "assets", "requirements.txt", "build.py", "gemini_gui.spec.tmpl")
+
+
+def _find_pyinstaller():
+    """PyInstaller launcher; falls back to the module when no script is on PATH."""
+    executable = shutil.which("pyinstaller")
+    return [executable] if executable else [sys.executable, "-m", "PyInstaller"]
+
+
+# Resolved once per run
+_PYINSTALLER = _find_pyinstaller()
+
+
+@dataclass
+class BuildEnv:
+    """File and tool probes shared by the build steps, made once per run."""
+    has_icon: bool
+    has_nsis: bool
+    python_exe: str
+    optimize: int = 1
+    
+    @classmethod
+    def detect(cls, optimize: int = 1) -> "BuildEnv":
+        """Probe the build machine without spawning any processes."""
+        return cls(
+            has_icon=ICON_PATH.is_file(),
+            has_nsis=shutil.which("makensis") is not None,
+            python_exe=sys.executable,
+            optimize=optimize,
+        )
+
+
+def run_command(argv, description):
+    """Run a command given as an argument list, echoing its output as it arrives."""
+    print(f"\n{description}...", flush=True)
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
-        print(f"✓ {description} completed successfully")
-        if result.stdout:
-            print(f"Output: {result.stdout}")
-        return True
-    except subprocess.CalledProcessError as e:
+        with subprocess.Popen(
+            argv, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1
+        ) as process:
+            for line in process.stdout:
+                sys.stdout.write(f"  {line}")
+        returncode = process.returncode
+    except OSError as e:
+        print(f"✗ {description} failed: {e}")
+        return False
+    
+    if returncode != 0:
         print(f"✗ {description} failed:")
-        print(f"  Command: {command}")
-        print(f"  Error: {e.stderr}")
+        print(f"  Command: {subprocess.list2cmdline(argv)}")
+        print(f"  Exit code: {returncode}")
         return False
+    
+    print(f"✓ {description} completed successfully")
+    return True
+
+
+def _input_signature(optimize: int) -> str:
+    """Hash the path, mtime and size of every build input, and the optimization level."""
+    digest = hashlib.blake2b(f"optimize={optimize}\n".encode("utf-8"))
+    for root in BUILD_INPUTS:
+        root_path = Path(root)
+        if root_path.is_file():
+            paths = [root_path]
+        elif root_path.is_dir():
+            paths = sorted(
+                path for path in root_path.rglob("*")
+                if path.is_file() and "__pycache__" not in path.parts
+            )
+        else:
+            continue
+        
+        for path in paths:
+            stat = path.stat()
+            digest.update(f"{path.as_posix()}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _installer_signature(nsis_script: str, exe_stat: os.stat_result) -> str:
+    """Hash the NSIS script together with the size and mtime of the executable."""
+    digest = hashlib.blake2b(nsis_script.encode("utf-8"))
+    digest.update(f"{exe_stat.st_mtime_ns}\0{exe_stat.st_size}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _stored_signature(signature_file: Path = SIGNATURE_FILE) -> str:
+    """Signature stored by the last successful build step, or '' if unknown."""
+    try:
+        return signature_file.read_text(encoding="utf-8").strip()
+    except OSError:
+        return ""
+
+
+def _store_signature(signature: str, signature_file: Path = SIGNATURE_FILE):
+    """Remember the inputs of a successful build step."""
+    try:
+        BUILD_CACHE_DIR.mkdir(exist_ok=True)
+        signature_file.write_text(signature, encoding="utf-8")
+    except OSError as e:
+        print(f"⚠ Could not write build signature: {e}")
+
+
+def _scandir_rmtree(path):
+    """Delete a directory tree, using scandir's cached entry types to avoid stats."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _scandir_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+def _fast_rmtree(path):
+    """Delete a directory tree with the OS's bulk delete, falling back to scandir."""
+    if sys.platform == "win32":
+        command = ["cmd", "/c", "rd", "/s", "/q", str(path)]
+    else:
+        command = ["rm", "-rf", "--", str(path)]
+    
+    try:
+        subprocess.run(command, check=True, capture_output=True)
+    except (subprocess.CalledProcessError, OSError):
+        pass
+    if os.path.exists(path):
+        _scandir_rmtree(path)
 
 
 def clean_build_directories():
@@ -32,90 +186,44 @@ def clean_build_directories():
     print("Cleaning build directories...")
     
     dirs_to_clean = ['build', 'dist', '__pycache__']
-    files_to_clean = ['*.spec']
     
     for dir_name in dirs_to_clean:
-        if Path(dir_name).exists():
-            shutil.rmtree(dir_name)
+        if os.path.isdir(dir_name):
+            _fast_rmtree(dir_name)
             print(f"  Removed {dir_name}/")
     
-    for pattern in files_to_clean:
-        for file_path in Path('.').glob(pattern):
-            file_path.unlink()
-            print(f"  Removed {file_path}")
+    # The current spec is kept; create_pyinstaller_spec only rewrites it when it changes
+    with os.scandir('.') as entries:
+        spec_files = [
+            entry.name for entry in entries
+            if entry.is_file() and entry.name.endswith('.spec') and entry.name != SPEC_PATH.name
+        ]
+    for file_name in spec_files:
+        os.unlink(file_name)
+        print(f"  Removed {file_name}")
     
     print("✓ Build directories cleaned")
 
 
-def create_pyinstaller_spec():
+def create_pyinstaller_spec(env: BuildEnv):
     """Create PyInstaller spec file."""
-    spec_content = '''# -*- mode: python ; coding: utf-8 -*-
-
-block_cipher = None
-
-a = Analysis(
-    ['app/main.py'],
-    pathex=[],
-    binaries=[],
-    datas=[
-        ('assets', 'assets'),
-    ],
-    hiddenimports=[
-        'sentence_transformers',
-        'chromadb',
-        'langchain',
-        'google.generativeai',
-        'keyring',
-        'loguru',
-        'pydantic',
-        'PyQt6.QtCore',
-        'PyQt6.QtGui',
-        'PyQt6.QtWidgets',
-    ],
-    hookspath=[],
-    hooksconfig={},
-    runtime_hooks=[],
-    excludes=[],
-    win_no_prefer_redirects=False,
-    win_private_assemblies=False,
-    cipher=block_cipher,
-    noarchive=False,
-)
-
-pyd = []
-for d in a.datas:
-    if 'pyconfig' not in d[0]:
-        pyd.append(d)
-a.datas = pyd
-
-pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
-
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    [],
-    name='CustomGeminiAgentGUI',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=False,
-    disable_windowed_traceback=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-    icon='assets/icon.ico' if Path('assets/icon.ico').exists() else None,
-)
-'''
+    spec_content = SPEC_TEMPLATE_PATH.read_text(encoding="utf-8").format_map({
+        "icon": ICON_PATH.as_posix() if env.has_icon else None,
+        "optimize": env.optimize,
+        "hidden_import_packages": HIDDEN_IMPORT_PACKAGES,
+        "excludes": SPEC_EXCLUDES,
+    })
     
     try:
-        with open('gemini_gui.spec', 'w') as f:
-            f.write(spec_content)
+        new_content = spec_content.encode("utf-8")
+        if SPEC_PATH.is_file() and SPEC_PATH.read_bytes() == new_content:
+            print("✓ PyInstaller spec file unchanged")
+            return True
+        
+        # Write beside the spec and swap it in, so a failed write never leaves half a file
+        tmp_path = SPEC_PATH.with_name(SPEC_PATH.name + ".tmp")
+        tmp_path.write_bytes(new_content)
+        os.replace(tmp_path, SPEC_PATH)
         print("✓ Created PyInstaller spec file")
         return True
     except Exception as e:
@@ -123,29 +231,30 @@ exe = EXE(
         return False
 
 
-def build_executable():
+def build_executable(env: BuildEnv):
     """Build the executable using PyInstaller."""
     commands = [
-        ("pyinstaller gemini_gui.spec", "Building executable with PyInstaller"),
+        # Populate __pycache__ on all cores so PyInstaller's analysis finds cached bytecode
+        ([env.python_exe, "-m", "compileall", "-j0", "-q", "-o", str(env.optimize), "app"], "Pre-compiling bytecode in parallel"),
+        # Keep PyInstaller's work files in the build cache so later builds reuse them
+        (_PYINSTALLER + ["--workpath", str(WORK_PATH), "--distpath", str(EXE_PATH.parent), str(SPEC_PATH)],
+         "Building executable with PyInstaller"),
     ]
     
-    for command, description in commands:
-        if not run_command(command, description):
+    for argv, description in commands:
+        if not run_command(argv, description):
             return False
     
     return True
 
 
-def create_installer():
+def create_installer(env: BuildEnv, exe_stat: os.stat_result):
     """Create an installer (Windows only)."""
     if sys.platform != "win32":
         print("Installer creation is only supported on Windows")
         return True
     
-    # Check if NSIS is available
-    try:
-        subprocess.run("makensis", shell=True, check=True, capture_output=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if not env.has_nsis:
         print("NSIS not found - skipping installer creation")
         print("Install NSIS from https://nsis.sourceforge.io/ to create installers")
         return True
@@ -193,56 +302,89 @@ sectionEnd
 '''
     
     try:
+        # Skip makensis when neither the script nor the executable changed
+        signature = _installer_signature(nsis_script, exe_stat)
+        if INSTALLER_PATH.exists() and signature == _stored_signature(INSTALLER_SIGNATURE_FILE):
+            print("✓ Installer cache hit - reusing previous installer")
+            return True
+        
         with open('installer.nsi', 'w') as f:
             f.write(nsis_script)
         
-        return run_command("makensis installer.nsi", "Creating Windows installer")
+        if not run_command(["makensis", "installer.nsi"], "Creating Windows installer"):
+            return False
+        _store_signature(signature, INSTALLER_SIGNATURE_FILE)
+        return True
     except Exception as e:
         print(f"✗ Failed to create installer: {e}")
         return False
 
 
-def verify_build():
-    """Verify the build was successful."""
-    exe_path = Path("dist/CustomGeminiAgentGUI.exe")
-    if exe_path.exists():
-        size_mb = exe_path.stat().st_size / (1024 * 1024)
-        print(f"✓ Executable created: {exe_path} ({size_mb:.1f} MB)")
-        return True
-    else:
+def verify_build() -> Optional[os.stat_result]:
+    """Verify the build was successful, returning the executable's stat or None."""
+    try:
+        exe_stat = os.stat(EXE_PATH)
+    except FileNotFoundError:
         print("✗ Executable not found in dist/")
-        return False
+        return None
+    
+    size_mb = exe_stat.st_size / (1024 * 1024)
+    print(f"✓ Executable created: {EXE_PATH} ({size_mb:.1f} MB)")
+    return exe_stat
 
 
-def main():
+def main(argv=None):
     """Main build function."""
+    parser = argparse.ArgumentParser(description="Build Custom Gemini Agent GUI")
+    parser.add_argument("--force", action="store_true", help="rebuild even if inputs are unchanged")
+    parser.add_argument(
+        "--optimize",
+        type=int,
+        choices=(0, 1, 2),
+        default=1,
+        help="bytecode optimization level: 1 strips asserts, 2 also strips docstrings (default: %(default)s)"
+    )
+    args = parser.parse_args(argv)
+    
     print("Custom Gemini Agent GUI - Build Script")
     print("=" * 50)
     
+    # Reuse the previous executable when none of its inputs changed
+    signature = _input_signature(args.optimize)
+    if not args.force and EXE_PATH.exists() and signature == _stored_signature():
+        print("✓ Build cache hit - inputs unchanged, reusing previous executable")
+        print(f"Executable: {EXE_PATH.absolute()}")
+        return 0
+    
+    env = BuildEnv.detect(optimize=args.optimize)
+    
     # Clean previous builds
     clean_build_directories()
     
     # Create spec file
-    if not create_pyinstaller_spec():
+    if not create_pyinstaller_spec(env):
         return 1
     
     # Build executable
-    if not build_executable():
+    if not build_executable(env):
         print("\n✗ Build failed")
         return 1
     
     # Verify build
-    if not verify_build():
+    exe_stat = verify_build()
+    if exe_stat is None:
         return 1
     
+    _store_signature(signature)
+    
     # Create installer (optional)
-    create_installer()
+    create_installer(env, exe_stat)
     
     print("\n✓ Build completed successfully!")
-    print(f"Executable: {Path('dist/CustomGeminiAgentGUI.exe').absolute()}")
+    print(f"Executable: {EXE_PATH.absolute()}")
     
-    if Path("CustomGeminiAgentGUI-Setup.exe").exists():
-        print(f"Installer: {Path('CustomGeminiAgentGUI-Setup.exe').absolute()}")
+    if INSTALLER_PATH.exists():
+        print(f"Installer: {INSTALLER_PATH.absolute()}")
     
     return 0
 
@@ -6,9 +6,15 @@ This script demonstrates the application functionality without requiring
 all external dependencies to be installed.
 """
 
+import argparse
+import importlib.util
+import io
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, NamedTuple
 
 # Add the app directory to Python path
 app_dir = Path(__file__).parent / "app"
@@ -18,13 +24,12 @@ def check_basic_imports():
     """Check if basic imports work."""
     print("Checking basic imports...")
     
-    try:
-        from PyQt6.QtWidgets import QApplication
+    # find_spec locates the package without paying for its import
+    pyqt_available = importlib.util.find_spec("PyQt6") is not None
+    if pyqt_available:
         print("✓ PyQt6 available")
-        pyqt_available = True
-    except ImportError as e:
-        print(f"✗ PyQt6 not available: {e}")
-        pyqt_available = False
+    else:
+        print("✗ PyQt6 not available: No module named 'PyQt6'")
     
     try:
         from loguru import logger
@@ -561,8 +566,128 @@ def test_import_export_service():
         print(f"✗ ImportExportService test failed: {e}")
         return False
 
-def main():
+class DemoTest(NamedTuple):
+    """A core demo test and how it may be scheduled."""
+    key: str  # name accepted by --only
+    label: str  # name shown in the summary
+    test: Callable[[], bool]
+    # Writes to the app directory (including the Chroma store) or patches module
+    # globals other tests read, so runs one at a time with the other such tests
+    writes_files: bool
+    requires_pyqt: bool  # imports PyQt6, so is skipped without it
+
+# Each test imports its services inside the function, so tests left out by --only
+# or skipped for lack of PyQt6 never import them.
+CORE_TESTS = [
+    DemoTest("config", "ConfigService", test_config_service, True, False),
+    DemoTest("api", "APIService", test_api_service, False, False),
+    DemoTest("rag", "Enhanced RAGService", test_rag_service, True, False),
+    DemoTest("monitoring", "MonitoringService", test_monitoring_service, False, True),
+    DemoTest("gdrive", "GoogleDriveService", test_google_drive_service, False, False),
+    DemoTest("webscraping", "WebScrapingService", test_web_scraping_service, True, False),
+    DemoTest("batch", "BatchProcessingService", test_batch_processing_service, False, True),
+    # Epic 5 services
+    DemoTest("template", "TemplateService", test_template_service, True, False),
+    DemoTest("workspace", "WorkspaceService", test_workspace_service, True, False),
+    DemoTest("session", "SessionService", test_session_service, True, False),
+    DemoTest("import_export", "ImportExportService", test_import_export_service, True, False),
+    DemoTest("controller", "MainController", test_main_controller, True, True),
+]
+
+class _ThreadOutput(io.TextIOBase):
+    """sys.stdout replacement that sends each thread's prints to its own buffer.
+    
+    Threads without a buffer write straight through to the real stdout.
+    """
+    
+    def __init__(self, stream):
+        super().__init__()
+        self.stream = stream
+        self._local = threading.local()
+    
+    def capture(self, buffer):
+        """Send this thread's output to buffer, or back to the stream if None."""
+        self._local.buffer = buffer
+    
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer or self.stream).write(text)
+    
+    def flush(self):
+        self.stream.flush()
+
+def _run_captured(test, output, lock=None):
+    """Run a demo test, returning its result and everything it printed."""
+    buffer = io.StringIO()
+    output.capture(buffer)
+    try:
+        if lock is None:
+            ok = test()
+        else:
+            with lock:
+                ok = test()
+    except Exception as e:
+        print(f"✗ {test.__name__} crashed: {e}")
+        ok = False
+    finally:
+        output.capture(None)
+    return ok, buffer.getvalue()
+
+def run_core_tests(tests, jobs):
+    """Run core tests, printing each one's output in table order.
+    
+    A test's prints are buffered and written to the console in a single call when
+    it finishes, whether the tests run concurrently or one at a time.
+    """
+    output = _ThreadOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        if jobs <= 1:
+            runs = ((entry.label, _run_captured(entry.test, output)) for entry in tests)
+            return [(label, _flush_run(output, run)) for label, run in runs]
+        
+        file_lock = threading.Lock()
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                (entry.label, executor.submit(
+                    _run_captured, entry.test, output, file_lock if entry.writes_files else None
+                ))
+                for entry in tests
+            ]
+            return [(label, _flush_run(output, future.result())) for label, future in futures]
+    finally:
+        sys.stdout = output.stream
+
+def _flush_run(output, run):
+    """Write a finished test's buffered output in one call and return its result."""
+    ok, text = run
+    output.stream.write(text)
+    output.stream.flush()
+    return ok
+
+def parse_args(argv=None):
+    """Parse demo command line arguments."""
+    parser = argparse.ArgumentParser(description="Custom Gemini Agent GUI demo")
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=[entry.key for entry in CORE_TESTS] + ["ui"],
+        metavar="TEST",
+        help="run only these tests (%(choices)s)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=min(8, os.cpu_count() or 1),
+        help="number of core tests to run at once; 1 runs them in order (default: %(default)s)"
+    )
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Main demo function."""
+    args = parse_args(argv)
+    selected = set(args.only) if args.only else None
+
     print("Custom Gemini Agent GUI - Demo Script")
     print("=" * 50)
     
@@ -570,31 +695,27 @@ def main():
     pyqt_available = check_basic_imports()
     
     # Test services
-    config_ok = test_config_service()
-    api_ok = test_api_service()
-    rag_ok = test_rag_service()
-    monitoring_ok = test_monitoring_service()
-    gdrive_ok = test_google_drive_service()
-    webscraping_ok = test_web_scraping_service()
-    batch_ok = test_batch_processing_service()
-
-    # Epic 5 services
-    template_ok = test_template_service()
-    workspace_ok = test_workspace_service()
-    session_ok = test_session_service()
-    import_export_ok = test_import_export_service()
-
-    controller_ok = test_main_controller()
+    tests = [entry for entry in CORE_TESTS if selected is None or entry.key in selected]
+    skipped = []
+    if not pyqt_available:
+        skipped = [entry.label for entry in tests if entry.requires_pyqt]
+        tests = [entry for entry in tests if not entry.requires_pyqt]
+        if skipped:
+            print(f"\nSkipping {', '.join(skipped)} (PyQt6 not available)")
+    results = run_core_tests(tests, args.jobs)
+    core_ok = all(ok for _, ok in results)
     
     # Test UI components if PyQt6 is available
     ui_ok = True
-    if pyqt_available:
+    run_ui = selected is None or "ui" in selected
+    if pyqt_available and run_ui:
         ui_ok = test_ui_components()
         
         # Run full demo
         full_demo_ok = run_full_demo()
     else:
-        print("\nSkipping UI tests (PyQt6 not available)")
+        if run_ui:
+            print("\nSkipping UI tests (PyQt6 not available)")
         full_demo_ok = False
     
     # Summary
@@ -602,23 +723,18 @@ def main():
     print("DEMO SUMMARY")
     print("=" * 50)
     print(f"PyQt6 Available: {'✓' if pyqt_available else '✗'}")
-    print(f"ConfigService: {'✓' if config_ok else '✗'}")
-    print(f"APIService: {'✓' if api_ok else '✗'}")
-    print(f"Enhanced RAGService: {'✓' if rag_ok else '✗'}")
-    print(f"MonitoringService: {'✓' if monitoring_ok else '✗'}")
-    print(f"GoogleDriveService: {'✓' if gdrive_ok else '✗'}")
-    print(f"WebScrapingService: {'✓' if webscraping_ok else '✗'}")
-    print(f"BatchProcessingService: {'✓' if batch_ok else '✗'}")
-    print(f"TemplateService: {'✓' if template_ok else '✗'}")
-    print(f"WorkspaceService: {'✓' if workspace_ok else '✗'}")
-    print(f"SessionService: {'✓' if session_ok else '✗'}")
-    print(f"ImportExportService: {'✓' if import_export_ok else '✗'}")
-    print(f"MainController: {'✓' if controller_ok else '✗'}")
-    print(f"UI Components: {'✓' if ui_ok else '✗'}")
-    print(f"Full Demo: {'✓' if full_demo_ok else '✗'}")
+    for label, ok in results:
+        print(f"{label}: {'✓' if ok else '✗'}")
+    for label in skipped:
+        print(f"{label}: skipped")
+    if run_ui and not pyqt_available:
+        print("UI Components: skipped")
+        print("Full Demo: skipped")
+    elif run_ui:
+        print(f"UI Components: {'✓' if ui_ok else '✗'}")
+        print(f"Full Demo: {'✓' if full_demo_ok else '✗'}")
     
-    if all([config_ok, api_ok, rag_ok, monitoring_ok, gdrive_ok, webscraping_ok, batch_ok,
-            template_ok, workspace_ok, session_ok, import_export_ok, controller_ok]):
+    if core_ok:
         print("\n🎉 Core functionality is working!")
         if pyqt_available and ui_ok:
             print("🎉 UI components are working!")
@@ -6,6 +6,7 @@ This script provides a convenient way to launch the application
 with proper error handling and environment setup.
 """
 
+import importlib.util
 import sys
 import os
 from pathlib import Path
@@ -14,24 +15,25 @@ from pathlib import Path
 app_dir = Path(__file__).parent / "app"
 sys.path.insert(0, str(app_dir))
 
+# (import name, pip package name) for each required dependency
+REQUIRED_PACKAGES = (
+    ('PyQt6', 'PyQt6'),
+    ('sentence_transformers', 'sentence-transformers'),
+    ('chromadb', 'chromadb'),
+    ('langchain', 'langchain'),
+    ('keyring', 'keyring'),
+    ('loguru', 'loguru'),
+    ('pydantic', 'pydantic'),
+)
+
 def check_dependencies():
     """Check if required dependencies are installed."""
-    required_packages = [
-        'PyQt6',
-        'sentence_transformers',
-        'chromadb',
-        'langchain',
-        'keyring',
-        'loguru',
-        'pydantic'
-    ]
-    
     missing_packages = []
     
-    for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
-        except ImportError:
+    # Locate packages without executing them; heavy ones are imported by the app later
+    modules = sys.modules
+    for import_name, package in REQUIRED_PACKAGES:
+        if import_name not in modules and importlib.util.find_spec(import_name) is None:
             missing_packages.append(package)
     
     if missing_packages:
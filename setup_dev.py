@@ -11,18 +11,23 @@ import os
 from pathlib import Path
 
 
-def run_command(command, description):
-    """Run a command and handle errors."""
-    print(f"\n{description}...")
+def run_command(argv, description):
+    """Run a command given as an argument list, letting its output stream to the terminal."""
+    print(f"\n{description}...", flush=True)
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
-        print(f"✓ {description} completed successfully")
-        return True
-    except subprocess.CalledProcessError as e:
+        result = subprocess.run(argv)
+    except OSError as e:
+        print(f"✗ {description} failed: {e}")
+        return False
+    
+    if result.returncode != 0:
         print(f"✗ {description} failed:")
-        print(f"  Command: {command}")
-        print(f"  Error: {e.stderr}")
+        print(f"  Command: {subprocess.list2cmdline(argv)}")
+        print(f"  Exit code: {result.returncode}")
         return False
+    
+    print(f"✓ {description} completed successfully")
+    return True
 
 
 def check_python_version():
@@ -40,28 +45,19 @@ def check_python_version():
 
 def install_dependencies():
     """Install project dependencies."""
-    commands = [
-        ("pip install --upgrade pip", "Upgrading pip"),
-        ("pip install -r requirements.txt", "Installing project dependencies"),
-    ]
-    
-    for command, description in commands:
-        if not run_command(command, description):
-            return False
-    
-    return True
+    # One pip run upgrades pip and installs the project and pre-commit, so pip's
+    # start-up and dependency resolution are paid once
+    return run_command(
+        [sys.executable, "-m", "pip", "install", "--upgrade", "pip", "-r", "requirements.txt", "pre-commit"],
+        "Installing project dependencies"
+    )
 
 
 def setup_pre_commit():
     """Set up pre-commit hooks."""
-    commands = [
-        ("pip install pre-commit", "Installing pre-commit"),
-        ("pre-commit install", "Setting up pre-commit hooks"),
-    ]
-    
-    for command, description in commands:
-        if not run_command(command, description):
-            print(f"Warning: {description} failed (optional)")
+    # pre-commit itself is installed by install_dependencies()
+    if not run_command([sys.executable, "-m", "pre_commit", "install"], "Setting up pre-commit hooks"):
+        print("Warning: Setting up pre-commit hooks failed (optional)")
     
     return True
 
@@ -102,7 +98,10 @@ def create_pre_commit_config():
 
 def run_tests():
     """Run the test suite."""
-    return run_command("python -m pytest tests/ -v", "Running tests")
+    return run_command(
+        [sys.executable, "-m", "pytest", "tests/", "-v", "-n", "auto", "--dist", "loadfile"],
+        "Running tests"
+    )
 
 
 def create_vscode_settings():
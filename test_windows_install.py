@@ -3,115 +3,69 @@
 Quick test script for Windows installation without lxml
 """
 
-def test_core_imports():
-    """Test core package imports"""
-    print("🔍 Testing Core Package Imports...")
-    
-    try:
-        import PyQt6
-        print("✅ PyQt6 imported successfully")
-    except ImportError as e:
-        print(f"❌ PyQt6 failed: {e}")
-    
-    try:
-        import google.generativeai
-        print("✅ Google Generative AI imported successfully")
-    except ImportError as e:
-        print(f"❌ Google Generative AI failed: {e}")
-    
-    try:
-        import chromadb
-        print("✅ ChromaDB imported successfully")
-    except ImportError as e:
-        print(f"❌ ChromaDB failed: {e}")
-    
-    try:
-        import sentence_transformers
-        print("✅ Sentence Transformers imported successfully")
-    except ImportError as e:
-        print(f"❌ Sentence Transformers failed: {e}")
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 
-def test_xml_alternatives():
-    """Test XML processing alternatives (no lxml)"""
-    print("\n🔍 Testing XML Processing Alternatives...")
-    
-    try:
-        import html5lib
-        print("✅ html5lib imported successfully")
-    except ImportError as e:
-        print(f"❌ html5lib failed: {e}")
-    
-    try:
-        import defusedxml.ElementTree
-        print("✅ defusedxml imported successfully")
-    except ImportError as e:
-        print(f"❌ defusedxml failed: {e}")
-    
-    try:
-        import xml.etree.ElementTree
-        print("✅ xml.etree (built-in) available")
-    except ImportError as e:
-        print(f"❌ xml.etree failed: {e}")
-    
-    try:
-        import xmltodict
-        print("✅ xmltodict imported successfully")
-    except ImportError as e:
-        print(f"❌ xmltodict failed: {e}")
+# (section heading, [(module to probe, display name), ...])
+CHECKS = [
+    ("🔍 Testing Core Package Imports...", [
+        ("PyQt6", "PyQt6"),
+        ("google.generativeai", "Google Generative AI"),
+        ("chromadb", "ChromaDB"),
+        ("sentence_transformers", "Sentence Transformers"),
+    ]),
+    ("🔍 Testing XML Processing Alternatives...", [
+        ("html5lib", "html5lib"),
+        ("defusedxml.ElementTree", "defusedxml"),
+        ("xml.etree.ElementTree", "xml.etree (built-in)"),
+        ("xmltodict", "xmltodict"),
+    ]),
+    ("🔍 Testing Web Scraping Capabilities...", [
+        ("requests", "requests"),
+        ("bs4", "BeautifulSoup4"),
+        ("trafilatura", "trafilatura"),
+    ]),
+    ("🔍 Testing Document Processing...", [
+        ("PyPDF2", "PyPDF2"),
+        ("docx", "python-docx"),
+        ("openpyxl", "openpyxl"),
+    ]),
+]
 
-def test_web_scraping():
-    """Test web scraping capabilities"""
-    print("\n🔍 Testing Web Scraping Capabilities...")
-    
-    try:
-        import requests
-        print("✅ requests imported successfully")
-    except ImportError as e:
-        print(f"❌ requests failed: {e}")
-    
-    try:
-        import bs4
-        print("✅ BeautifulSoup4 imported successfully")
-    except ImportError as e:
-        print(f"❌ BeautifulSoup4 failed: {e}")
+def is_installed(module_name):
+    """Check whether a module can be found, without executing it.
     
+    For dotted names only the parent packages are imported, which find_spec needs
+    to search their paths.
+    """
     try:
-        import trafilatura
-        print("✅ trafilatura imported successfully")
-    except ImportError as e:
-        print(f"❌ trafilatura failed: {e}")
+        return importlib.util.find_spec(module_name) is not None
+    except ImportError:
+        # A missing parent package
+        return False
 
-def test_document_processing():
-    """Test document processing capabilities"""
-    print("\n🔍 Testing Document Processing...")
-    
-    try:
-        import PyPDF2
-        print("✅ PyPDF2 imported successfully")
-    except ImportError as e:
-        print(f"❌ PyPDF2 failed: {e}")
-    
-    try:
-        import docx
-        print("✅ python-docx imported successfully")
-    except ImportError as e:
-        print(f"❌ python-docx failed: {e}")
-    
-    try:
-        import openpyxl
-        print("✅ openpyxl imported successfully")
-    except ImportError as e:
-        print(f"❌ openpyxl failed: {e}")
+def run_checks():
+    """Probe every package listed in CHECKS"""
+    module_names = [module_name for _, packages in CHECKS for module_name, _ in packages]
+    
+    # Probes are mostly filesystem lookups, so run them side by side
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        installed = dict(zip(module_names, executor.map(is_installed, module_names)))
+    
+    for index, (heading, packages) in enumerate(CHECKS):
+        print(f"\n{heading}" if index else heading)
+        for module_name, display_name in packages:
+            if installed[module_name]:
+                print(f"✅ {display_name} found")
+            else:
+                print(f"❌ {display_name} not found ({module_name})")
 
 def main():
     """Main test function"""
     print("🧪 Windows Installation Test (No lxml)")
     print("=" * 50)
     
-    test_core_imports()
-    test_xml_alternatives()
-    test_web_scraping()
-    test_document_processing()
+    run_checks()
     
     print("\n📊 Test Summary:")
     print("If all tests show ✅, your installation is working correctly!")
@@ -0,0 +1,60 @@
+"""
+Shared pytest fixtures
+"""
+
+import importlib.util
+import shutil
+import pytest
+from unittest.mock import patch, MagicMock
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Create the QApplication once and share it with every Qt test module."""
+    from PyQt6.QtWidgets import QApplication
+    yield QApplication.instance() or QApplication([])
+
+
+@pytest.fixture(scope="session")
+def golden_home(tmp_path_factory):
+    """Home directory with the built-in templates and default workspace already written."""
+    from services.config_service import ConfigService
+    from services.template_service import TemplateService
+    from services.workspace_service import WorkspaceService
+
+    home = tmp_path_factory.mktemp("golden_home")
+    config_service = ConfigService(base_dir=home)
+    TemplateService(config_service)
+    WorkspaceService(config_service)
+    return home
+
+
+@pytest.fixture
+def config_service(tmp_path, golden_home):
+    """Create a ConfigService instance with temporary directory.
+
+    The directory starts as a copy of the golden home, so services built on top
+    find their bootstrap files on disk instead of writing them again.
+    """
+    from services.config_service import ConfigService
+    shutil.copytree(golden_home, tmp_path, dirs_exist_ok=True)
+    return ConfigService(base_dir=tmp_path)
+
+
+@pytest.fixture(scope="session")
+def shared_embedding_model():
+    """Replace the sentence-transformers model with a mock for the rest of the session.
+
+    RAGService imports SentenceTransformer when it initializes, so patching the
+    class on its module keeps tests from loading the real model weights. Only
+    modules that build a RAGService request it, so other runs never import
+    sentence-transformers.
+    """
+    if importlib.util.find_spec("sentence_transformers") is None:
+        # RAGService skips the model entirely when the package is missing
+        yield None
+        return
+
+    with patch("sentence_transformers.SentenceTransformer") as mock_model_class:
+        mock_model_class.return_value = MagicMock()
+        yield mock_model_class
@@ -0,0 +1,135 @@
+"""
+Tests for ChatWidget
+"""
+
+import pytest
+from PyQt6.QtCore import QItemSelectionModel
+from PyQt6.QtWidgets import QApplication
+
+from widgets.chat_widget import ChatWidget, ChatMessage, _render_message_html
+
+
+def _contents(widget: ChatWidget) -> list:
+    """Contents of the displayed rows, oldest first."""
+    return [message.content for message in widget.chat_model.messages]
+
+
+class TestChatWidget:
+    """Test cases for ChatWidget."""
+    
+    @pytest.fixture
+    def chat_widget(self, qapp):
+        """Create a ChatWidget with a small row cap and no welcome message."""
+        widget = ChatWidget(max_messages=3)
+        widget.chat_model.clear()
+        yield widget
+        widget.deleteLater()
+    
+    def test_append_messages(self, chat_widget):
+        """Test that messages are displayed and recorded in order."""
+        chat_widget.add_user_message("Hello")
+        chat_widget.add_assistant_message("Hi there")
+        chat_widget.add_system_message("Note")
+        
+        assert _contents(chat_widget) == ["Hello", "Hi there", "Note"]
+        
+        # System messages are display-only
+        history = chat_widget.get_chat_history()
+        assert [(entry["role"], entry["content"]) for entry in history] == [
+            ("user", "Hello"), ("assistant", "Hi there")
+        ]
+    
+    def test_row_cap_drops_oldest_rows(self, chat_widget):
+        """Test that the display keeps only the newest max_messages rows."""
+        for i in range(5):
+            chat_widget.add_user_message(f"Message {i}")
+        
+        assert _contents(chat_widget) == ["Message 2", "Message 3", "Message 4"]
+        
+        # The history is not limited by the display cap
+        assert len(chat_widget.get_chat_history()) == 5
+    
+    def test_chat_history_snapshot(self, chat_widget):
+        """Test that the history snapshot is shared, read-only and updated on change."""
+        chat_widget.add_user_message("First")
+        snapshot = chat_widget.get_chat_history()
+        
+        assert chat_widget.get_chat_history() is snapshot
+        with pytest.raises(TypeError):
+            snapshot[0]["content"] = "Changed"
+        
+        chat_widget.add_assistant_message("Second")
+        updated = chat_widget.get_chat_history()
+        assert [entry["content"] for entry in updated] == ["First", "Second"]
+        assert updated[0] is snapshot[0]
+    
+    def test_set_chat_history_reuses_common_prefix(self, chat_widget):
+        """Test that rows matching the start of the new history are kept."""
+        chat_widget.add_user_message("Question")
+        chat_widget.add_assistant_message("Answer")
+        kept_rows = list(chat_widget.chat_model.messages)
+        
+        history = [dict(entry) for entry in chat_widget.get_chat_history()]
+        history.append({"role": "user", "content": "Follow-up", "timestamp": "12:00:00"})
+        chat_widget.set_chat_history(history)
+        
+        assert _contents(chat_widget) == ["Question", "Answer", "Follow-up"]
+        assert chat_widget.chat_model.messages[0] is kept_rows[0]
+        assert chat_widget.chat_model.messages[1] is kept_rows[1]
+    
+    def test_set_chat_history_replaces_diverging_rows(self, chat_widget):
+        """Test that rows after the first difference are replaced."""
+        chat_widget.set_chat_history([
+            {"role": "user", "content": "A", "timestamp": "12:00:00"},
+            {"role": "assistant", "content": "B", "timestamp": "12:00:01"},
+        ])
+        first_row = chat_widget.chat_model.messages[0]
+        
+        chat_widget.set_chat_history([
+            {"role": "user", "content": "A", "timestamp": "12:00:00"},
+            {"role": "assistant", "content": "C", "timestamp": "12:00:02"},
+        ])
+        
+        assert _contents(chat_widget) == ["A", "C"]
+        assert chat_widget.chat_model.messages[0] is first_row
+        assert [entry["content"] for entry in chat_widget.get_chat_history()] == ["A", "C"]
+    
+    def test_render_escapes_html(self):
+        """Test that message content is escaped and newlines become line separators."""
+        message = ChatMessage("user", "<b>Tom & Jerry</b>\nline two", "12:00:00")
+        html = _render_message_html(message)
+        
+        assert "&lt;b&gt;Tom &amp; Jerry&lt;/b&gt;\u2028line two" in html
+        assert "<b>Tom" not in html
+        assert "\n" not in html
+        
+        # The HTML is cached on the message
+        assert _render_message_html(message) is html
+    
+    def test_copy_selected_messages(self, chat_widget):
+        """Test that selected messages are copied whole, oldest first."""
+        chat_widget.add_user_message("First")
+        chat_widget.add_assistant_message("Second\nwith two lines")
+        chat_widget.add_user_message("Third")
+        
+        selection = chat_widget.chat_display.selectionModel()
+        model = chat_widget.chat_model
+        selection.select(model.index(2), QItemSelectionModel.SelectionFlag.Select)
+        selection.select(model.index(1), QItemSelectionModel.SelectionFlag.Select)
+        
+        chat_widget.copy_action.trigger()
+        
+        assert QApplication.clipboard().text() == "Second\nwith two lines\n\nThird"
+    
+    def test_set_max_messages(self, chat_widget):
+        """Test that lowering the cap drops the oldest rows and raising it keeps the rest."""
+        for i in range(3):
+            chat_widget.add_user_message(f"Message {i}")
+        
+        chat_widget.set_max_messages(2)
+        assert _contents(chat_widget) == ["Message 1", "Message 2"]
+        
+        chat_widget.set_max_messages(4)
+        chat_widget.add_user_message("Message 3")
+        chat_widget.add_user_message("Message 4")
+        assert _contents(chat_widget) == ["Message 1", "Message 2", "Message 3", "Message 4"]
@@ -3,38 +3,22 @@ Tests for ConfigService
 """
 
 import pytest
-import tempfile
-import shutil
-from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-# Add app directory to path for imports
-import sys
-app_dir = Path(__file__).parent.parent / "app"
-sys.path.insert(0, str(app_dir))
-
 from services.config_service import ConfigService, GemConfiguration, AppSettings
 
 
 class TestConfigService:
     """Test cases for ConfigService."""
     
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for testing."""
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
-    
-    @pytest.fixture
-    def config_service(self, temp_dir):
-        """Create a ConfigService instance with temporary directory."""
-        with patch('pathlib.Path.home', return_value=temp_dir):
-            service = ConfigService()
-            return service
+    @pytest.fixture(scope="module")
+    def readonly_config_service(self, tmp_path_factory):
+        """Create one ConfigService shared by tests that do not modify it."""
+        return ConfigService(base_dir=tmp_path_factory.mktemp("cfg"))
     
-    def test_initialization(self, config_service):
+    def test_initialization(self, readonly_config_service):
         """Test ConfigService initialization."""
+        config_service = readonly_config_service
         assert config_service.app_dir.exists()
         assert config_service.config_dir.exists()
         assert config_service.gems_dir.exists()
@@ -50,10 +34,9 @@ class TestConfigService:
         assert config_service.save_settings() is True
         
         # Create new service instance to test loading
-        with patch('pathlib.Path.home', return_value=config_service.app_dir.parent):
-            new_service = ConfigService()
-            assert new_service.settings.auto_save_interval == 600
-            assert new_service.settings.max_chat_history == 2000
+        new_service = ConfigService(base_dir=config_service.app_dir.parent)
+        assert new_service.settings.auto_save_interval == 600
+        assert new_service.settings.max_chat_history == 2000
     
     @patch('keyring.set_password')
     @patch('keyring.get_password')
@@ -112,13 +95,14 @@ class TestConfigService:
         gem_list_after_delete = config_service.list_gem_configurations()
         assert "test_gem" not in gem_list_after_delete
     
-    def test_nonexistent_gem_configuration(self, config_service):
+    def test_nonexistent_gem_configuration(self, readonly_config_service):
         """Test loading nonexistent gem configuration."""
-        config = config_service.load_gem_configuration("nonexistent")
+        config = readonly_config_service.load_gem_configuration("nonexistent")
         assert config is None
     
-    def test_directory_properties(self, config_service):
+    def test_directory_properties(self, readonly_config_service):
         """Test directory property methods."""
+        config_service = readonly_config_service
         assert config_service.get_app_directory() == config_service.app_dir
         assert config_service.get_config_directory() == config_service.config_dir
         assert config_service.get_gems_directory() == config_service.gems_dir
@@ -3,42 +3,29 @@ Tests for Enhanced RAG Service (Epic 3)
 """
 
 import pytest
-import tempfile
-import shutil
-from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
-# Add app directory to path for imports
-import sys
-app_dir = Path(__file__).parent.parent / "app"
-sys.path.insert(0, str(app_dir))
-
-from services.rag_service import RAGService
 from services.config_service import ConfigService
-from services.monitoring_service import MonitoringService
 from models.knowledge_source import KnowledgeSource, SourceType, SourceStatus
 
+pytestmark = pytest.mark.usefixtures("shared_embedding_model")
+
 
 class TestEnhancedRAGService:
     """Test cases for enhanced RAG service functionality."""
     
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for testing."""
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
-    
-    @pytest.fixture
-    def config_service(self, temp_dir):
-        """Create a ConfigService instance with temporary directory."""
-        with patch('pathlib.Path.home', return_value=temp_dir):
-            service = ConfigService()
-            return service
-    
     @pytest.fixture
     def rag_service(self, config_service):
         """Create a RAGService instance."""
+        from services.rag_service import RAGService
+        return RAGService(config_service)
+    
+    @pytest.fixture(scope="module")
+    def readonly_rag_service(self, tmp_path_factory):
+        """Create one RAGService shared by tests that do not modify it."""
+        from services.rag_service import RAGService
+        config_service = ConfigService(base_dir=tmp_path_factory.mktemp("cfg"))
         return RAGService(config_service)
     
     def test_smart_chunking_code_files(self, rag_service):
@@ -68,8 +55,9 @@ def function2():
         assert len(chunks) > 0
         assert isinstance(chunks, list)
     
-    def test_determine_chunk_type(self, rag_service):
+    def test_determine_chunk_type(self, readonly_rag_service):
         """Test chunk type determination."""
+        rag_service = readonly_rag_service
         assert rag_service._determine_chunk_type(".py") == "code"
         assert rag_service._determine_chunk_type(".js") == "code"
         assert rag_service._determine_chunk_type(".md") == "documentation"
@@ -81,8 +69,8 @@ def function2():
         """Test enhanced search with content type filtering."""
         # Mock the collection and embedding model
         with patch.object(rag_service, '_is_rag_available', return_value=True):
-            with patch.object(rag_service, 'collection') as mock_collection:
-                with patch.object(rag_service, 'embedding_model') as mock_embedding:
+            with patch.object(rag_service, 'collection', MagicMock(spec=["query"])) as mock_collection:
+                with patch.object(rag_service, 'embedding_model', MagicMock(spec=["encode"])) as mock_embedding:
                     
                     # Setup mocks
                     mock_embedding.encode.return_value = [[0.1, 0.2, 0.3]]
@@ -109,6 +97,16 @@ def function2():
                     assert "relevance_score" in results[0]
                     assert "similarity" in results[0]
     
+    def test_build_where_clause(self, readonly_rag_service):
+        """Test metadata filter construction for searches."""
+        build = readonly_rag_service._build_where_clause
+        assert build() is None
+        assert build(content_type="code") == {"chunk_type": "code"}
+        assert build(source_filter="src") == {"source_id": "src"}
+        assert build(content_type="code", source_filter="src") == {
+            "$and": [{"chunk_type": "code"}, {"source_id": "src"}]
+        }
+    
     def test_relevance_score_calculation(self, rag_service):
         """Test relevance score calculation."""
         query = "python function code"
@@ -126,42 +124,49 @@ def function2():
     
     def test_batch_processing(self, rag_service):
         """Test batch processing of chunks."""
+        import numpy as np
+        from services.rag_service import Chunks
+        
         # Create mock chunks
-        chunks = [
-            {
-                "content": f"Test content {i}",
-                "metadata": {"chunk_index": i, "source_id": "test"}
-            }
-            for i in range(150)  # More than batch size
-        ]
+        total = 2500  # More than two full batches
+        chunks = Chunks(
+            contents=[f"Test content {i}" for i in range(total)],
+            metadatas=[{"chunk_index": i, "source_id": "test"} for i in range(total)],
+            ids=[f"test_source_{i}" for i in range(total)]
+        )
         
-        with patch.object(rag_service, '_is_rag_available', return_value=True):
-            with patch.object(rag_service, 'collection') as mock_collection:
-                with patch.object(rag_service, 'embedding_model') as mock_embedding:
-                    
-                    # Mock embedding generation
-                    mock_embedding.encode.return_value = [[0.1, 0.2, 0.3]] * 100
-                    
-                    # Test batch processing
-                    rag_service._store_chunks(chunks, "test_source")
-                    
-                    # Should be called multiple times for batches
-                    assert mock_collection.add.call_count >= 2
+        # Plain recording stubs; call-record fidelity of MagicMock is not needed here
+        encoded = []
+        added = []
+        
+        def encode(texts, **kwargs):
+            encoded.append(texts)
+            return np.array([[0.1, 0.2, 0.3]] * len(texts))
+        
+        embedding_model = SimpleNamespace(encode=encode)
+        collection = SimpleNamespace(add=lambda **kwargs: added.append(kwargs))
+        
+        with patch.object(rag_service, 'collection', collection):
+            with patch.object(rag_service, 'embedding_model', embedding_model):
+                rag_service._store_chunks(chunks)
+        
+        # All chunks are encoded in a single call
+        assert len(encoded) == 1
+        assert len(encoded[0]) == total
+        
+        # Storage is split into ChromaDB-sized batches
+        assert len(added) == 3
+        stored_ids = [chunk_id for call in added for chunk_id in call["ids"]]
+        assert stored_ids == [f"test_source_{i}" for i in range(total)]
 
 
 class TestMonitoringService:
     """Test cases for file monitoring service."""
     
-    @pytest.fixture
-    def temp_dir(self):
-        """Create a temporary directory for testing."""
-        temp_dir = tempfile.mkdtemp()
-        yield Path(temp_dir)
-        shutil.rmtree(temp_dir)
-    
     @pytest.fixture
     def monitoring_service(self):
         """Create a MonitoringService instance."""
+        from services.monitoring_service import MonitoringService
         return MonitoringService()
     
     def test_monitoring_service_initialization(self, monitoring_service):
@@ -170,10 +175,10 @@ class TestMonitoringService:
         assert not monitoring_service.is_monitoring
         assert len(monitoring_service.monitored_sources) == 0
     
-    def test_add_file_monitoring(self, monitoring_service, temp_dir):
+    def test_add_file_monitoring(self, monitoring_service, tmp_path):
         """Test adding file monitoring."""
         # Create a test file
-        test_file = temp_dir / "test.txt"
+        test_file = tmp_path / "test.txt"
         test_file.write_text("test content")
         
         # Create knowledge source
@@ -197,12 +202,12 @@ class TestMonitoringService:
                 assert source.id in monitoring_service.monitored_sources
                 assert source.status == SourceStatus.MONITORING
     
-    def test_monitoring_without_watchdog(self, monitoring_service, temp_dir):
+    def test_monitoring_without_watchdog(self, monitoring_service, tmp_path):
         """Test monitoring behavior when watchdog is not available."""
         # Create knowledge source
         source = KnowledgeSource(
             id="test_source",
-            path=str(temp_dir / "test.txt"),
+            path=str(tmp_path / "test.txt"),
             source_type=SourceType.FILE,
             name="Test File"
         )
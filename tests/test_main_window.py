@@ -2,162 +2,140 @@
 Tests for MainWindow
 """
 
-import pytest
 import sys
-from pathlib import Path
-from unittest.mock import patch, MagicMock
-
-# Add app directory to path for imports
-app_dir = Path(__file__).parent.parent / "app"
-sys.path.insert(0, str(app_dir))
+import pytest
+from unittest.mock import create_autospec, patch, MagicMock
 
-from PyQt6.QtWidgets import QApplication
 from PyQt6.QtTest import QTest
 from PyQt6.QtCore import Qt
 
-from main_window import MainWindow
-from services.config_service import ConfigService
-
-
-@pytest.fixture(scope="session")
-def qapp():
-    """Create QApplication instance for testing."""
-    if not QApplication.instance():
-        app = QApplication([])
-        yield app
-        app.quit()
-    else:
-        yield QApplication.instance()
+# main_window imports every service, but MainController is always patched here,
+# so hide the Google SDKs and let those services take their ImportError fallbacks
+UNUSED_SDKS = ("google.generativeai", "googleapiclient")
+with patch.dict(sys.modules, dict.fromkeys(UNUSED_SDKS)):
+    import main_window
+    from main_window import MainWindow
+    from services.config_service import ConfigService
 
 
-@pytest.fixture
-def mock_config_service():
-    """Create a mock config service."""
-    mock_service = MagicMock(spec=ConfigService)
+@pytest.fixture(scope="module")
+def mock_config_service(tmp_path_factory):
+    """Create a mock config service shared by the module's tests."""
+    # settings is assigned in __init__, so it is not part of the class spec
+    mock_service = create_autospec(ConfigService, instance=True)
     mock_service.get_api_key.return_value = None
+    mock_service.get_app_directory.return_value = tmp_path_factory.mktemp("app_dir")
     mock_service.settings = MagicMock()
     mock_service.settings.auto_save_interval = 300
+    mock_service.settings.max_chat_history = 1000
     return mock_service
 
 
+@pytest.fixture(autouse=True)
+def reset_mock_config_service(mock_config_service):
+    """Clear calls recorded on the shared config service by earlier tests."""
+    yield
+    mock_config_service.reset_mock()
+
+
+@pytest.fixture
+def mock_controller():
+    """Patch MainController with a mock whose instance initializes successfully."""
+    with patch.object(main_window, 'MainController') as mock_controller_class:
+        mock_controller_class.return_value.initialize.return_value = True
+        yield mock_controller_class
+
+
 class TestMainWindow:
     """Test cases for MainWindow."""
     
-    def test_main_window_initialization(self, qapp, mock_config_service):
-        """Test MainWindow initialization."""
-        with patch('main_window.MainController') as mock_controller:
-            # Setup mock controller
-            mock_controller_instance = MagicMock()
-            mock_controller.return_value = mock_controller_instance
-            mock_controller_instance.initialize.return_value = True
+    @pytest.fixture(scope="class")
+    def window(self, qapp, mock_config_service):
+        """Create one MainWindow for the tests that only inspect it."""
+        with patch.object(main_window, 'MainController') as mock_controller_class:
+            mock_controller_class.return_value.initialize.return_value = True
             
-            # Create main window
             window = MainWindow(mock_config_service)
-            
-            # Verify window was created
-            assert window is not None
-            assert window.windowTitle() == "Custom Gemini Agent GUI"
-            
-            # Verify controller was initialized
-            mock_controller.assert_called_once()
-            mock_controller_instance.initialize.assert_called_once()
+            yield window
+            window.close()
+    
+    def test_main_window_initialization(self, qapp, mock_config_service, mock_controller):
+        """Test MainWindow initialization."""
+        # Create main window
+        window = MainWindow(mock_config_service)
+        
+        # Verify window was created
+        assert window is not None
+        assert window.windowTitle() == "Custom Gemini Agent GUI"
+        
+        # Verify controller was initialized
+        mock_controller.assert_called_once()
+        mock_controller.return_value.initialize.assert_called_once()
     
-    def test_ui_components_exist(self, qapp, mock_config_service):
+    def test_ui_components_exist(self, window):
         """Test that all UI components are created."""
-        with patch('main_window.MainController') as mock_controller:
-            mock_controller_instance = MagicMock()
-            mock_controller.return_value = mock_controller_instance
-            mock_controller_instance.initialize.return_value = True
-            
-            window = MainWindow(mock_config_service)
-            
-            # Check that widgets exist
-            assert hasattr(window, 'instructions_widget')
-            assert hasattr(window, 'knowledge_widget')
-            assert hasattr(window, 'chat_widget')
-            assert hasattr(window, 'controller')
-            assert hasattr(window, 'message_worker')
+        # Check that widgets exist
+        expected = {'instructions_widget', 'knowledge_widget', 'chat_widget', 'controller', 'message_worker'}
+        missing = expected - vars(window).keys()
+        assert not missing, f"MainWindow is missing {sorted(missing)}"
     
-    def test_menu_actions(self, qapp, mock_config_service):
+    def test_menu_actions(self, window):
         """Test menu actions."""
-        with patch('main_window.MainController') as mock_controller:
-            mock_controller_instance = MagicMock()
-            mock_controller.return_value = mock_controller_instance
-            mock_controller_instance.initialize.return_value = True
-            
-            window = MainWindow(mock_config_service)
-            
-            # Test that menu bar exists
-            menu_bar = window.menuBar()
-            assert menu_bar is not None
-            
-            # Check for main menus
-            menus = [action.text() for action in menu_bar.actions()]
-            assert '&File' in menus
-            assert '&Settings' in menus
-            assert '&Help' in menus
+        # Test that menu bar exists
+        menu_bar = window.menuBar()
+        assert menu_bar is not None
+        
+        # Check for main menus
+        menus = [action.text() for action in menu_bar.actions()]
+        assert '&File' in menus
+        assert '&Settings' in menus
+        assert '&Help' in menus
     
-    def test_status_bar(self, qapp, mock_config_service):
+    def test_status_bar(self, window):
         """Test status bar functionality."""
-        with patch('main_window.MainController') as mock_controller:
-            mock_controller_instance = MagicMock()
-            mock_controller.return_value = mock_controller_instance
-            mock_controller_instance.initialize.return_value = True
-            
-            window = MainWindow(mock_config_service)
-            
-            # Check status bar exists
-            status_bar = window.statusBar()
-            assert status_bar is not None
-            
-            # Test status message
-            test_message = "Test status message"
-            status_bar.showMessage(test_message)
-            assert status_bar.currentMessage() == test_message
+        # Check status bar exists
+        status_bar = window.statusBar()
+        assert status_bar is not None
+        
+        # Test status message
+        test_message = "Test status message"
+        status_bar.showMessage(test_message)
+        assert status_bar.currentMessage() == test_message
     
-    @patch('main_window.QInputDialog.getText')
-    def test_new_gem_configuration(self, mock_input_dialog, qapp, mock_config_service):
+    @patch.object(main_window.QInputDialog, 'getText')
+    def test_new_gem_configuration(self, mock_input_dialog, qapp, mock_config_service, mock_controller):
         """Test creating a new gem configuration."""
-        with patch('main_window.MainController') as mock_controller:
-            mock_controller_instance = MagicMock()
-            mock_controller.return_value = mock_controller_instance
-            mock_controller_instance.initialize.return_value = True
-            mock_controller_instance.create_new_gem_configuration.return_value = True
-            
-            # Setup input dialog mock
-            mock_input_dialog.return_value = ("Test Agent", True)
+        mock_controller_instance = mock_controller.return_value
+        mock_controller_instance.create_new_gem_configuration.return_value = True
+        
+        # Setup input dialog mock
+        mock_input_dialog.return_value = ("Test Agent", True)
+        
+        window = MainWindow(mock_config_service)
+        
+        # Call new configuration method
+        window.new_gem_configuration()
+        
+        # Verify controller method was called
+        mock_controller_instance.create_new_gem_configuration.assert_called_once_with("Test Agent")
+    
+    def test_message_worker_integration(self, qapp, mock_config_service, mock_controller):
+        """Test message worker integration."""
+        with patch.object(main_window, 'MessageWorker') as mock_worker:
+            mock_worker_instance = MagicMock()
+            mock_worker.return_value = mock_worker_instance
             
             window = MainWindow(mock_config_service)
             
-            # Call new configuration method
-            window.new_gem_configuration()
+            # Verify worker was created
+            mock_worker.assert_called_once_with(mock_controller.return_value)
             
-            # Verify controller method was called
-            mock_controller_instance.create_new_gem_configuration.assert_called_once_with("Test Agent")
-    
-    def test_message_worker_integration(self, qapp, mock_config_service):
-        """Test message worker integration."""
-        with patch('main_window.MainController') as mock_controller:
-            with patch('main_window.MessageWorker') as mock_worker:
-                mock_controller_instance = MagicMock()
-                mock_controller.return_value = mock_controller_instance
-                mock_controller_instance.initialize.return_value = True
-                
-                mock_worker_instance = MagicMock()
-                mock_worker.return_value = mock_worker_instance
-                
-                window = MainWindow(mock_config_service)
-                
-                # Verify worker was created
-                mock_worker.assert_called_once_with(mock_controller_instance)
-                
-                # Test message sending
-                test_message = "Hello, AI!"
-                window.on_message_sent(test_message)
-                
-                # Verify worker send_message was called
-                mock_worker_instance.send_message.assert_called_once()
-
+            # Test message sending
+            test_message = "Hello, AI!"
+            window.on_message_sent(test_message)
+            
+            # Verify worker send_message was called
+            mock_worker_instance.send_message.assert_called_once()
 
 if __name__ == "__main__":
     pytest.main([__file__])